@@ -1,5 +1,7 @@
 """Main entrypoint for the MCP OCI OPSI server."""
 
+import datetime
+import json
 import logging
 import os
 import threading
@@ -9,6 +11,11 @@ import oci
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .logging_config import configure_logging
 from .bootstrap import MCPBootstrap
 
@@ -49,8 +56,32 @@ from .tools import (
 # Note: OCA OAuth tools removed - this is a public OPSI MCP without OCA dependencies
 # OCA authentication is handled by the parent DB OPS agent only
 
+def _json_default(value) -> str:
+    """Fallback encoder: ISO-8601 for datetimes, str() for anything else.
+
+    Tool results carry raw datetime objects so orjson can render them in
+    C; the stdlib path must match that wire format (str(datetime) would
+    use a space separator instead of "T").
+    """
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _serialize_tool_result(data) -> str:
+    """Serialize tool results with orjson when installed.
+
+    Large warehouse and listing payloads make JSON encoding the second CPU
+    hotspot after SDK deserialization; orjson encodes them several times
+    faster than the stdlib. Falls back to json when orjson is absent.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=_json_default).decode()
+    return json.dumps(data, default=_json_default)
+
+
 # Initialize FastMCP application
-app = FastMCP("oci-opsi")
+app = FastMCP("oci-opsi", tool_serializer=_serialize_tool_result)
 logger = logging.getLogger(__name__)
 
 
@@ -570,11 +601,14 @@ def list_enhanced_compartments(profile: Optional[str] = None, max_age_hours: int
 # ============================================================================
 
 @app.tool()
-def list_database_insights(
+async def list_database_insights(
     compartment_id: str,
     lifecycle_state: Optional[str] = None,
     page: Optional[str] = None,
     limit: Optional[int] = None,
+    auto_paginate: bool = True,
+    max_items: int = 10000,
+    max_age: Optional[int] = None,
 ) -> dict:
     """
     List database insights in a compartment with optional filtering.
@@ -583,18 +617,29 @@ def list_database_insights(
         compartment_id: Compartment OCID to query.
         lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE", "DELETED").
         page: Page token for pagination (from previous response).
-        limit: Maximum number of items to return per page.
+        limit: Maximum number of items to return. With auto_paginate this
+            caps the total result; otherwise it is the per-page size.
+        auto_paginate: Fetch all pages automatically (default True); set
+            False for manual page-token paging.
+        max_items: Safety cap on total items when auto-paginating.
+        max_age: Maximum cached-result age in seconds (default 30).
+            Pass 0 to bypass the cache and always hit the service.
 
     Returns:
         Dictionary containing database insights list and pagination info.
     """
-    return tools_opsi.list_database_insights(compartment_id, lifecycle_state, page, limit)
+    return await tools_opsi.list_database_insights_async(
+        compartment_id, lifecycle_state, page, limit, auto_paginate, max_items, max_age
+    )
 
 
 @app.tool()
-def query_warehouse_standard(
+async def query_warehouse_standard(
     compartment_id: str,
     statement: str,
+    region: Optional[str] = None,
+    columnar: bool = False,
+    return_format: str = "dict",
 ) -> dict:
     """
     Execute a standard SQL query against the Operations Insights warehouse.
@@ -605,19 +650,26 @@ def query_warehouse_standard(
     Args:
         compartment_id: Compartment OCID for the query scope.
         statement: SQL query statement to execute against the warehouse.
+        region: Optional region override for regional warehouse data.
+        columnar: If True, return one list per column instead of row dicts -
+            much cheaper to serialize for large result sets.
+        return_format: "dict" (default) or "arrow" for an Arrow-encoded
+            payload when pyarrow is installed.
 
     Returns:
         Dictionary containing query results with columns and rows.
     """
-    return tools_opsi.query_warehouse_standard(compartment_id, statement)
+    return await tools_opsi.query_warehouse_standard_async(
+        compartment_id, statement, region, columnar, return_format
+    )
 
 
 @app.tool()
-def list_sql_texts(
+async def list_sql_texts(
     compartment_id: str,
     time_start: str,
     time_end: str,
-    database_id: Optional[str] = None,
+    database_id: Optional[Union[str, List[str]]] = None,
     sql_identifier: Optional[str] = None,
 ) -> dict:
     """
@@ -630,13 +682,14 @@ def list_sql_texts(
         compartment_id: Compartment OCID to query.
         time_start: Start time in ISO format (e.g., "2024-01-01T00:00:00Z").
         time_end: End time in ISO format (e.g., "2024-01-31T23:59:59Z").
-        database_id: Optional database OCID to filter results.
+        database_id: Optional database OCID (or list of OCIDs, fetched
+            concurrently and merged) to filter results.
         sql_identifier: Optional SQL identifier to retrieve specific SQL text.
 
     Returns:
         Dictionary containing SQL text data with statistics.
     """
-    return tools_opsi.list_sql_texts(compartment_id, time_start, time_end, database_id, sql_identifier)
+    return await tools_opsi.list_sql_texts_async(compartment_id, time_start, time_end, database_id, sql_identifier)
 
 
 @app.tool()
@@ -742,6 +795,364 @@ def summarize_database_insights(
         }
 
 
+# ============================================================================
+# Extended OPSI Tools
+# ============================================================================
+
+
+@app.tool()
+def summarize_sql_statistics(
+    compartment_id: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    database_id: Optional[str] = None,
+    database_ids: Optional[List[str]] = None,
+    as_columns: bool = False,
+    summary_only: bool = False,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    Summarize SQL statistics for databases in a compartment.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        time_interval_start: Start time in ISO format (e.g., "2024-01-01T00:00:00Z").
+        time_interval_end: End time in ISO format (e.g., "2024-01-31T23:59:59Z").
+        database_id: Optional database insight OCID filter (region auto-detected).
+        database_ids: Optional list of database insight OCIDs, sent as one
+            batched filter; IDs spanning regions are fanned out per region.
+        as_columns: If True, return "columns" (one list per field) instead of
+            per-row "items" dicts - cheaper for multi-thousand-row summaries.
+        summary_only: If True, return only the total count and the top 10
+            statements by CPU time.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing SQL statistics summary.
+    """
+    return tools_opsi_extended.summarize_sql_statistics(
+        compartment_id, time_interval_start, time_interval_end,
+        database_id=database_id, database_ids=database_ids,
+        as_columns=as_columns, summary_only=summary_only, bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def get_sql_plan(
+    compartment_id: str,
+    sql_identifier: str,
+    plan_hash: int,
+    database_id: Optional[str] = None,
+) -> dict:
+    """
+    Get SQL execution plan details for a specific SQL identifier.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        sql_identifier: SQL identifier from SQL statistics.
+        plan_hash: Plan hash value identifying the execution plan.
+        database_id: Optional database insight OCID filter.
+
+    Returns:
+        Dictionary containing the execution plan steps.
+    """
+    return tools_opsi_extended.get_sql_plan(compartment_id, sql_identifier, plan_hash, database_id)
+
+
+@app.tool()
+def summarize_database_insight_resource_capacity_trend(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    database_id: Optional[str] = None,
+    database_ids: Optional[List[str]] = None,
+    timestamp_format: str = "iso",
+    summary_only: bool = False,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    Get capacity planning trends for database resource utilization.
+
+    Args:
+        compartment_id: Compartment OCID.
+        resource_metric: Resource metric (CPU, STORAGE, MEMORY, IO).
+        time_interval_start: Start time in ISO format.
+        time_interval_end: End time in ISO format.
+        database_id: Optional database OCID filter.
+        database_ids: Optional list of database OCIDs (one batched call).
+        timestamp_format: "iso" (default) or "epoch_ms" for int timestamps.
+        summary_only: If True, return p50/p95/max utilization scalars instead
+            of the per-point trend list.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing capacity trend analysis.
+    """
+    return tools_opsi_extended.summarize_database_insight_resource_capacity_trend(
+        compartment_id, resource_metric, time_interval_start, time_interval_end,
+        database_id=database_id, database_ids=database_ids,
+        timestamp_format=timestamp_format, summary_only=summary_only,
+        bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def summarize_database_insight_resource_forecast(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    forecast_days: int = 30,
+    database_id: Optional[str] = None,
+    database_ids: Optional[List[str]] = None,
+    timestamp_format: str = "iso",
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    Get resource utilization forecast for capacity planning.
+
+    Args:
+        compartment_id: Compartment OCID.
+        resource_metric: Resource metric (CPU, STORAGE, MEMORY, IO).
+        time_interval_start: Start time in ISO format.
+        time_interval_end: End time in ISO format.
+        forecast_days: Number of days to forecast (default 30).
+        database_id: Optional database OCID filter.
+        database_ids: Optional list of database OCIDs (one batched call).
+        timestamp_format: "iso" (default) or "epoch_ms" for int timestamps.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing resource forecast data.
+    """
+    return tools_opsi_extended.summarize_database_insight_resource_forecast(
+        compartment_id, resource_metric, time_interval_start, time_interval_end,
+        forecast_days=forecast_days, database_id=database_id, database_ids=database_ids,
+        timestamp_format=timestamp_format, bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def summarize_host_insight_resource_statistics(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    host_id: Optional[str] = None,
+    host_ids: Optional[List[str]] = None,
+    summary_only: bool = False,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    Get resource statistics for host insights.
+
+    Args:
+        compartment_id: Compartment OCID.
+        resource_metric: Resource metric (CPU, MEMORY, NETWORK, STORAGE).
+        time_interval_start: Start time in ISO format.
+        time_interval_end: End time in ISO format.
+        host_id: Optional host insight OCID filter.
+        host_ids: Optional list of host insight OCIDs (one batched call).
+        summary_only: If True, return p50/p95/max utilization scalars instead
+            of the per-host item list.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing host resource statistics.
+    """
+    return tools_opsi_extended.summarize_host_insight_resource_statistics(
+        compartment_id, resource_metric, time_interval_start, time_interval_end,
+        host_id=host_id, host_ids=host_ids, summary_only=summary_only,
+        bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def list_host_insights(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+    host_type: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_token: Optional[str] = None,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    List host insights in a compartment.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE").
+        host_type: Filter by host type.
+        max_items: Stop after this many items; the response then carries
+            "next_page_token" for resuming.
+        page_token: Resume listing from a previous response's token.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing list of host insights.
+    """
+    return tools_opsi_extended.list_host_insights(
+        compartment_id, lifecycle_state, host_type,
+        max_items=max_items, page_token=page_token, bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def list_exadata_insights(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_token: Optional[str] = None,
+    bypass_cache: bool = False,
+) -> dict:
+    """
+    List Exadata insights in a compartment.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE").
+        max_items: Stop after this many items; the response then carries
+            "next_page_token" for resuming.
+        page_token: Resume listing from a previous response's token.
+        bypass_cache: Skip the cached result and force a live OCI call.
+
+    Returns:
+        Dictionary containing list of Exadata insights.
+    """
+    return tools_opsi_extended.list_exadata_insights(
+        compartment_id, lifecycle_state,
+        max_items=max_items, page_token=page_token, bypass_cache=bypass_cache,
+    )
+
+
+@app.tool()
+def run_opsi_batch(requests: List[dict]) -> dict:
+    """
+    Run several read-only OPSI tool calls concurrently in one round trip.
+
+    Args:
+        requests: List of {"tool": name, "params": {...}} dicts naming
+            read-only tools from the extended OPSI module (e.g.
+            "list_host_insights", "summarize_sql_statistics").
+
+    Returns:
+        Dictionary with per-request results in input order; a failure in
+        one call is returned inline without aborting the others.
+    """
+    return tools_opsi_extended.run_opsi_batch(requests)
+
+
+@app.tool()
+async def get_host_overview(
+    compartment_id: str,
+    resource_metric: str = "CPU",
+    time_interval_start: Optional[str] = None,
+    time_interval_end: Optional[str] = None,
+) -> dict:
+    """
+    Fetch the common host dashboard bundle with one concurrent fan-out.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        resource_metric: Resource metric for statistics and trend (default CPU).
+        time_interval_start: Start time in ISO format. Defaults to 24 hours ago.
+        time_interval_end: End time in ISO format. Defaults to now.
+
+    Returns:
+        Dictionary with "hosts", "statistics", and "capacity_trend" sections.
+    """
+    return await tools_opsi_extended.get_host_overview(
+        compartment_id, resource_metric, time_interval_start, time_interval_end
+    )
+
+
+# ============================================================================
+# Database Registration and Management Tools
+# ============================================================================
+
+
+@app.tool()
+def enable_database_insights_bulk(items: List[dict]) -> dict:
+    """
+    Enable Operations Insights for many databases concurrently.
+
+    Args:
+        items: List of dicts, each containing database_id and compartment_id
+            plus optional entity_source and credential_details.
+
+    Returns:
+        Dictionary with per-item results in input order and summary counts.
+    """
+    return tools_database_registration.enable_database_insights_bulk(items)
+
+
+@app.tool()
+def is_database_insight_enabled(database_id: str, compartment_id: str) -> dict:
+    """
+    Cheap existence check: is Operations Insights enabled for a database?
+
+    Args:
+        database_id: Database OCID to check.
+        compartment_id: Compartment OCID containing the database.
+
+    Returns:
+        Dictionary with the database OCID and an "enabled" boolean.
+    """
+    return {
+        "database_id": database_id,
+        "enabled": tools_database_registration.is_database_insight_enabled(
+            database_id, compartment_id
+        ),
+    }
+
+
+@app.tool()
+def enable_database_management(
+    database_id: str,
+    service_name: str,
+    credential_details: dict,
+    enable_management_type: str = "ADVANCED",
+    await_completion: bool = False,
+) -> dict:
+    """
+    Enable Database Management for a database.
+
+    Args:
+        database_id: Database OCID to enable management for.
+        service_name: Database service name for connection.
+        credential_details: Credentials for database connection (username, password, role).
+        enable_management_type: Management type (BASIC or ADVANCED).
+        await_completion: If True, poll the resulting work request (up to 30s)
+            and include its final status in the result.
+
+    Returns:
+        Dictionary containing enablement status and work request OCID.
+    """
+    return tools_database_registration.enable_database_management(
+        database_id, service_name, credential_details, enable_management_type, await_completion
+    )
+
+
+@app.tool()
+def get_managed_database_overview(
+    database_id: str,
+    include: Optional[List[str]] = None,
+) -> dict:
+    """
+    Get database details, tablespace usage, and parameters in one call.
+
+    Args:
+        database_id: Managed Database OCID.
+        include: Sections to fetch ("details", "tablespaces", "parameters").
+            Defaults to all three.
+
+    Returns:
+        Dictionary with one key per requested section.
+    """
+    return tools_dbmanagement.get_managed_database_overview(database_id, include)
+
+
 # ============================================================================
 # SQL Watch Tools
 # ============================================================================
@@ -1,7 +1,11 @@
 """OCI client factories and utilities."""
 
 from typing import Any, Callable, List, Optional
+import atexit
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import oci
 import os
@@ -10,17 +14,83 @@ from .config import get_oci_config, get_signer_and_region
 
 logger = logging.getLogger(__name__)
 
+# Process-wide executor for concurrent OCI fan-out, created lazily
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide thread pool used for concurrent OCI fan-out.
+
+    Tool modules share this single pool instead of constructing their
+    own: thread creation costs real time and stack memory, and a shared
+    pool gives one place to bound total concurrency against OCI rate
+    limits. Sized with OPSI_MAX_WORKERS (default 16).
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("OPSI_MAX_WORKERS", "16")),
+                    thread_name_prefix="opsi",
+                )
+                atexit.register(_EXECUTOR.shutdown, wait=False)
+    return _EXECUTOR
+
 # Default client settings with env overrides to bound latency and retries
 DEFAULT_CLIENT_TIMEOUT = int(os.getenv("OCI_CLIENT_TIMEOUT", "30"))
 OPSI_CLIENT_TIMEOUT = int(os.getenv("OPSI_CLIENT_TIMEOUT", str(DEFAULT_CLIENT_TIMEOUT)))
 DBM_CLIENT_TIMEOUT = int(os.getenv("DBM_CLIENT_TIMEOUT", str(DEFAULT_CLIENT_TIMEOUT)))
 CLIENT_RETRY_STRATEGY = oci.retry.DEFAULT_RETRY_STRATEGY
 
-
+# Short region codes embedded in OCIDs mapped to full region identifiers
+_REGION_SHORT_CODES = {
+    "phx": "us-phoenix-1",
+    "iad": "us-ashburn-1",
+    "fra": "eu-frankfurt-1",
+    "lhr": "uk-london-1",
+    "ams": "eu-amsterdam-1",
+    "zrh": "eu-zurich-1",
+    "jed": "me-jeddah-1",
+    "mel": "ap-melbourne-1",
+    "syd": "ap-sydney-1",
+    "gru": "sa-saopaulo-1",
+    "vcp": "sa-vinhedo-1",
+    "yul": "ca-montreal-1",
+    "yyz": "ca-toronto-1",
+    "nrt": "ap-tokyo-1",
+    "kix": "ap-osaka-1",
+    "icn": "ap-seoul-1",
+    "bom": "ap-mumbai-1",
+    "hyd": "ap-hyderabad-1",
+    "sin": "ap-singapore-1",
+    "dxb": "me-dubai-1",
+    "cwl": "uk-cardiff-1",
+    "ltn": "uk-gov-london-1",
+    "pia": "us-gov-ashburn-1",
+    "tus": "us-gov-phoenix-1",
+    "lin": "eu-milan-1",
+    "mrs": "eu-marseille-1",
+    "arn": "eu-stockholm-1",
+    "cdg": "eu-paris-1",
+    "jnb": "af-johannesburg-1",
+    "mtz": "il-jerusalem-1",
+    "scl": "sa-santiago-1",
+    "vap": "sa-valparaiso-1",
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def get_ocid_resource_type(ocid: str) -> Optional[str]:
     """
     Extract the resource type from an OCI OCID.
 
+    Results are memoized: tools validate, region-detect, and error-report
+    against the same OCID within one call, so the parse runs once per
+    distinct OCID.
+
     OCI OCIDs have the format:
     ocid1.<RESOURCE_TYPE>.<REALM>.[REGION][.FUTURE_USE].<UNIQUE_ID>
 
@@ -56,10 +126,14 @@ def get_ocid_resource_type(ocid: str) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_region_from_ocid(ocid: str) -> Optional[str]:
     """
     Extract region from an OCI resource OCID.
 
+    Results are memoized: OCIDs are immutable strings and tools parse the
+    same ones repeatedly, so the parse runs once per distinct OCID.
+
     OCI OCIDs have the format:
     ocid1.<RESOURCE_TYPE>.<REALM>.[REGION][.FUTURE_USE].<UNIQUE_ID>
 
@@ -87,45 +161,9 @@ def extract_region_from_ocid(ocid: str) -> Optional[str]:
         # Format: ocid1.<resource>.<realm>.<region>.<unique_id>
         region_code = parts[3]
 
-        # Map common short codes to full region names
-        region_map = {
-            "phx": "us-phoenix-1",
-            "iad": "us-ashburn-1",
-            "fra": "eu-frankfurt-1",
-            "lhr": "uk-london-1",
-            "ams": "eu-amsterdam-1",
-            "zrh": "eu-zurich-1",
-            "jed": "me-jeddah-1",
-            "mel": "ap-melbourne-1",
-            "syd": "ap-sydney-1",
-            "gru": "sa-saopaulo-1",
-            "vcp": "sa-vinhedo-1",
-            "yul": "ca-montreal-1",
-            "yyz": "ca-toronto-1",
-            "nrt": "ap-tokyo-1",
-            "kix": "ap-osaka-1",
-            "icn": "ap-seoul-1",
-            "bom": "ap-mumbai-1",
-            "hyd": "ap-hyderabad-1",
-            "sin": "ap-singapore-1",
-            "dxb": "me-dubai-1",
-            "cwl": "uk-cardiff-1",
-            "ltn": "uk-gov-london-1",
-            "pia": "us-gov-ashburn-1",
-            "tus": "us-gov-phoenix-1",
-            "lin": "eu-milan-1",
-            "mrs": "eu-marseille-1",
-            "arn": "eu-stockholm-1",
-            "cdg": "eu-paris-1",
-            "jnb": "af-johannesburg-1",
-            "mtz": "il-jerusalem-1",
-            "scl": "sa-santiago-1",
-            "vap": "sa-valparaiso-1",
-        }
-
         # Check if it's a short code that needs mapping
-        if region_code in region_map:
-            return region_map[region_code]
+        if region_code in _REGION_SHORT_CODES:
+            return _REGION_SHORT_CODES[region_code]
 
         # If it's already a full region name (e.g., "us-phoenix-1"), return as-is
         # Full region names contain hyphens
@@ -139,10 +177,15 @@ def extract_region_from_ocid(ocid: str) -> Optional[str]:
         return None
 
 
+@functools.lru_cache(maxsize=16)
 def get_opsi_client(use_resource_principal: bool = False, region: str = None) -> oci.opsi.OperationsInsightsClient:
     """
     Create and return an OCI Operations Insights client.
 
+    Clients are cached per (auth mode, region): construction re-parses
+    config and builds a fresh requests.Session, so reuse keeps the TLS
+    connection pool warm across tool calls.
+
     Args:
         use_resource_principal: If True, use Resource Principal authentication.
                               Defaults to False (user principal).
@@ -176,6 +219,7 @@ def get_opsi_client(use_resource_principal: bool = False, region: str = None) ->
         client = oci.opsi.OperationsInsightsClient(config, retry_strategy=CLIENT_RETRY_STRATEGY)
 
     _apply_timeout(client, OPSI_CLIENT_TIMEOUT)
+    _tune_connection_pool(client)
     return client
 
 
@@ -218,6 +262,21 @@ def get_dbm_client(use_resource_principal: bool = False, region: str = None) ->
     return client
 
 
+def _tune_connection_pool(client: Any) -> None:
+    """Mount a wider urllib3 pool so fan-out threads reuse TLS connections."""
+    try:
+        from requests.adapters import HTTPAdapter
+
+        pool_size = int(os.getenv("OPSI_MAX_WORKERS", "16"))
+        if hasattr(client, "base_client") and hasattr(client.base_client, "session"):
+            client.base_client.session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size),
+            )
+    except Exception as exc:  # best-effort
+        logger.debug("Could not tune OCI client connection pool: %s", exc)
+
+
 def _apply_timeout(client: Any, timeout_seconds: int) -> None:
     """Apply connect/read timeout to OCI clients without breaking if unsupported."""
     try:
@@ -9,6 +9,7 @@ from .config_enhanced import get_oci_config
 
 # Re-export utility functions from base module
 from .oci_clients import (
+    _tune_connection_pool,
     get_ocid_resource_type,
     extract_region_from_ocid,
     list_all,
@@ -73,6 +74,7 @@ def get_opsi_client(
 
         client = oci.opsi.OperationsInsightsClient(config)
 
+    _tune_connection_pool(client)
     return client
 
 
@@ -130,6 +132,7 @@ def get_dbm_client(
 
         client = oci.database_management.DbManagementClient(config)
 
+    _tune_connection_pool(client)
     return client
 
 
@@ -156,7 +159,9 @@ def get_identity_client(
         >>> prod_client = get_identity_client(profile="production")
     """
     config = get_oci_config(profile=profile)
-    return oci.identity.IdentityClient(config)
+    client = oci.identity.IdentityClient(config)
+    _tune_connection_pool(client)
+    return client
 
 
 @lru_cache(maxsize=16)
@@ -184,7 +189,9 @@ def get_database_client(
     if region:
         config["region"] = region
 
-    return oci.database.DatabaseClient(config)
+    client = oci.database.DatabaseClient(config)
+    _tune_connection_pool(client)
+    return client
 
 
 def clear_client_cache():
@@ -7,7 +7,9 @@ to maintain compatibility with tools that expect clients in the same folder.
 from ..oci_clients import (
     get_opsi_client,
     get_dbm_client,
+    get_shared_executor,
     list_all,
+    list_all_generator,
     extract_region_from_ocid,
     get_ocid_resource_type,
 )
@@ -19,7 +21,9 @@ __all__ = [
     "get_opsi_client",
     "get_dbm_client",
     "get_database_management_client",
+    "get_shared_executor",
     "list_all",
+    "list_all_generator",
     "extract_region_from_ocid",
     "get_ocid_resource_type",
 ]
@@ -17,6 +17,7 @@ from ..oci_clients import (
     extract_region_from_ocid,
     get_ocid_resource_type,
     list_all,
+    list_all_generator,
 )
 
 __all__ = [
@@ -28,4 +29,5 @@ __all__ = [
     "extract_region_from_ocid",
     "get_ocid_resource_type",
     "list_all",
+    "list_all_generator",
 ]
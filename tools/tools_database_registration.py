@@ -1,8 +1,114 @@
 """FastMCP tools for OCI Database Registration and Enablement."""
 
+import functools
+import re
+import time
 from typing import Any, Optional
 
-from .oci_clients import get_opsi_client, get_dbm_client
+import oci
+
+from .oci_clients import get_opsi_client, get_dbm_client, get_shared_executor
+
+# One-time SDK model imports so hot paths skip per-call import bytecode;
+# names are None when the installed SDK predates the model
+try:
+    from oci.opsi.models import (
+        CreateDatabaseInsightDetails,
+        CreateAutonomousDatabaseInsightDetails,
+        CreateEmManagedExternalDatabaseInsightDetails,
+        ChangeDatabaseInsightCompartmentDetails,
+        UpdateDatabaseInsightDetails,
+    )
+except ImportError:
+    CreateDatabaseInsightDetails = None
+    CreateAutonomousDatabaseInsightDetails = None
+    CreateEmManagedExternalDatabaseInsightDetails = None
+    ChangeDatabaseInsightCompartmentDetails = None
+    UpdateDatabaseInsightDetails = None
+
+try:
+    from oci.database.models import EnableDatabaseManagementDetails
+except ImportError:
+    EnableDatabaseManagementDetails = None
+
+# One-time capability probe: decides SDK vs raw-API path without paying
+# for exception construction/unwinding on every call
+_HAS_INSIGHT_MODELS = CreateAutonomousDatabaseInsightDetails is not None
+
+# Precompiled matcher for the benign "insight already exists" failure class
+_ALREADY_ENABLED_RE = re.compile(r"already\s+(exists|enabled)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_config() -> dict:
+    """Load the OCI config file once and reuse it for every call."""
+    return oci.config.from_file()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_database_client(region: Optional[str] = None) -> "oci.database.DatabaseClient":
+    """
+    Return a cached Database service client, one per region override.
+
+    Reusing the client keeps the underlying requests.Session (and its
+    TCP/TLS connection pool) warm across calls, mirroring the
+    get_opsi_client/get_dbm_client factories in oci_clients.
+    """
+    config = dict(_get_cached_config())
+    if region:
+        config["region"] = region
+    return oci.database.DatabaseClient(config)
+
+
+def _iso(dt: Any) -> Optional[str]:
+    """ISO-8601 string for a datetime, or None when the field is unset."""
+    return dt.isoformat() if dt is not None else None
+
+
+@functools.lru_cache(maxsize=16)
+def _get_work_requests_client(region: Optional[str] = None) -> "oci.work_requests.WorkRequestClient":
+    """Return a cached Work Requests client, one per region override."""
+    config = dict(_get_cached_config())
+    if region:
+        config["region"] = region
+    return oci.work_requests.WorkRequestClient(config)
+
+
+def _await_work_request(work_request_id: str, timeout_seconds: int = 30) -> dict[str, Any]:
+    """
+    Poll a work request with exponential backoff until it finishes or times out.
+
+    Uses the cached Work Requests client so every poll reuses the same
+    warm TLS connection instead of paying a handshake per poll.
+    """
+    try:
+        client = _get_work_requests_client()
+
+        deadline = time.monotonic() + timeout_seconds
+        delay = 0.5
+        while True:
+            response = client.get_work_request(work_request_id=work_request_id)
+            status = getattr(response.data, "status", None)
+            if status not in ("ACCEPTED", "IN_PROGRESS", "WAITING"):
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 4.0)
+
+        return {
+            "work_request_id": work_request_id,
+            "status": status,
+            "percent_complete": getattr(response.data, "percent_complete", None),
+        }
+
+    except Exception as e:
+        return {
+            "work_request_id": work_request_id,
+            "error": str(e),
+            "type": type(e).__name__,
+        }
 
 
 def enable_database_insight(
@@ -35,14 +141,8 @@ def enable_database_insight(
     try:
         client = get_opsi_client()
 
-        # Try using the SDK method
-        try:
-            from oci.opsi.models import (
-                CreateDatabaseInsightDetails,
-                CreateAutonomousDatabaseInsightDetails,
-                CreateEmManagedExternalDatabaseInsightDetails,
-            )
-
+        # SDK path when the installed SDK ships the insight models
+        if _HAS_INSIGHT_MODELS:
             # Create appropriate insight details based on entity source
             if entity_source == "AUTONOMOUS_DATABASE":
                 insight_details = CreateAutonomousDatabaseInsightDetails(
@@ -72,43 +172,41 @@ def enable_database_insight(
                 "message": "Database insight created successfully",
             }
 
-        except (AttributeError, ImportError) as e:
-            # Fallback to raw API call
-            path = "/20200630/databaseInsights"
+        # Raw API fallback for SDKs without the insight models
+        path = "/20200630/databaseInsights"
 
-            body = {
-                "compartmentId": compartment_id,
-                "databaseId": database_id,
-                "entitySource": entity_source,
-            }
-
-            if credential_details:
-                body["credentialDetails"] = credential_details
+        body = {
+            "compartmentId": compartment_id,
+            "databaseId": database_id,
+            "entitySource": entity_source,
+        }
 
-            response = client.base_client.call_api(
-                resource_path=path,
-                method="POST",
-                body=body,
-                response_type="object",
-            )
+        if credential_details:
+            body["credentialDetails"] = credential_details
 
-            if response.status in [200, 201]:
-                data = response.data
-                return {
-                    "database_id": database_id,
-                    "database_insight_id": getattr(data, "id", None),
-                    "status": getattr(data, "status", None),
-                    "message": "Database insight created successfully",
-                }
+        response = client.base_client.call_api(
+            resource_path=path,
+            method="POST",
+            body=body,
+            response_type="object",
+        )
 
+        if response.status in [200, 201]:
+            data = response.data
             return {
-                "error": f"API call failed with status {response.status}",
                 "database_id": database_id,
+                "database_insight_id": getattr(data, "id", None),
+                "status": getattr(data, "status", None),
+                "message": "Database insight created successfully",
             }
 
+        return {
+            "error": f"API call failed with status {response.status}",
+            "database_id": database_id,
+        }
+
     except Exception as e:
-        error_msg = str(e).lower()
-        if "already exists" in error_msg or "already enabled" in error_msg:
+        if _ALREADY_ENABLED_RE.search(str(e)):
             return {
                 "database_id": database_id,
                 "status": "already_enabled",
@@ -122,6 +220,48 @@ def enable_database_insight(
         }
 
 
+def enable_database_insights_bulk(
+    items: list[dict],
+) -> dict[str, Any]:
+    """
+    Enable Operations Insights for many databases concurrently.
+
+    OCI has no server-side batch endpoint for insight creation, so fleet
+    onboarding otherwise degenerates into N sequential round-trips. This
+    tool fans the CreateDatabaseInsight calls out over a thread pool and
+    reports per-database results in input order, including the
+    "already_enabled" special case handled by enable_database_insight.
+
+    Args:
+        items: List of dicts, each containing database_id and
+               compartment_id plus optional entity_source and
+               credential_details (same semantics as enable_database_insight).
+
+    Returns:
+        Dictionary with per-item results in input order and summary counts.
+    """
+    futures = [
+        get_shared_executor().submit(
+            enable_database_insight,
+            database_id=item.get("database_id"),
+            compartment_id=item.get("compartment_id"),
+            entity_source=item.get("entity_source", "AUTONOMOUS_DATABASE"),
+            credential_details=item.get("credential_details"),
+        )
+        for item in items
+    ]
+
+    results = [future.result() for future in futures]
+    error_count = sum(1 for r in results if "error" in r)
+
+    return {
+        "results": results,
+        "count": len(results),
+        "succeeded": len(results) - error_count,
+        "failed": error_count,
+    }
+
+
 def disable_database_insight(
     database_insight_id: str,
 ) -> dict[str, Any]:
@@ -160,6 +300,7 @@ def enable_database_management(
     service_name: str,
     credential_details: dict,
     enable_management_type: str = "ADVANCED",
+    await_completion: bool = False,
 ) -> dict[str, Any]:
     """
     Enable Database Management for a database.
@@ -169,6 +310,9 @@ def enable_database_management(
         service_name: Database service name for connection.
         credential_details: Credentials for database connection (username, password, role).
         enable_management_type: Management type (BASIC or ADVANCED).
+        await_completion: If True, poll the resulting work request (up to
+                          30s) and include its final status in the result,
+                          saving callers a separate polling round-trip.
 
     Returns:
         Dictionary containing enablement status and work request OCID.
@@ -186,14 +330,9 @@ def enable_database_management(
     """
     try:
         # This uses the database service API, not database management API
-        import oci
-
-        config = oci.config.from_file()
-        database_client = oci.database.DatabaseClient(config)
+        database_client = _get_database_client()
 
         try:
-            from oci.database.models import EnableDatabaseManagementDetails
-
             enable_details = EnableDatabaseManagementDetails(
                 credential_details=credential_details,
                 private_end_point_id=None,  # Public endpoint
@@ -220,6 +359,9 @@ def enable_database_management(
                 if work_req:
                     result["work_request_id"] = work_req
 
+            if await_completion and "work_request_id" in result:
+                result["work_request"] = _await_work_request(result["work_request_id"])
+
             return result
 
         except Exception as e:
@@ -254,22 +396,28 @@ def get_database_insight_status(
     try:
         client = get_opsi_client()
 
-        # List database insights and find matching database
+        # Filter server-side by database_id so the response only contains
+        # matches instead of the whole compartment's inventory
+        # A database maps to at most a handful of insights, so cap the
+        # page size to keep response framing tiny
         response = client.list_database_insights(
             compartment_id=compartment_id,
+            database_id=[database_id],
+            limit=10,
         )
 
+        matches = getattr(response.data, "items", response.data)
+
         insights = []
-        for insight in response.data:
-            if insight.database_id == database_id:
-                insights.append({
-                    "database_insight_id": insight.id,
-                    "database_id": insight.database_id,
-                    "database_name": insight.database_name,
-                    "status": insight.status,
-                    "lifecycle_state": insight.lifecycle_state,
-                    "entity_source": getattr(insight, "entity_source", None),
-                })
+        for insight in matches:
+            insights.append({
+                "database_insight_id": insight.id,
+                "database_id": insight.database_id,
+                "database_name": insight.database_name,
+                "status": insight.status,
+                "lifecycle_state": insight.lifecycle_state,
+                "entity_source": getattr(insight, "entity_source", None),
+            })
 
         return {
             "database_id": database_id,
@@ -286,6 +434,40 @@ def get_database_insight_status(
         }
 
 
+def is_database_insight_enabled(
+    database_id: str,
+    compartment_id: str,
+) -> bool:
+    """
+    Cheap existence check: is Operations Insights enabled for a database?
+
+    Unlike get_database_insight_status this returns on the first hit
+    without building per-insight dicts, so it is the right primitive for
+    "is it enabled?" gating in scripts and bulk flows.
+
+    Args:
+        database_id: Database OCID to check.
+        compartment_id: Compartment OCID containing the database.
+
+    Returns:
+        True if at least one database insight exists for the database.
+    """
+    try:
+        client = get_opsi_client()
+
+        response = client.list_database_insights(
+            compartment_id=compartment_id,
+            database_id=[database_id],
+            limit=1,
+        )
+
+        matches = getattr(response.data, "items", response.data)
+        return bool(matches)
+
+    except Exception:
+        return False
+
+
 def change_database_insight_compartment(
     database_insight_id: str,
     target_compartment_id: str,
@@ -304,8 +486,6 @@ def change_database_insight_compartment(
         client = get_opsi_client()
 
         try:
-            from oci.opsi.models import ChangeDatabaseInsightCompartmentDetails
-
             change_details = ChangeDatabaseInsightCompartmentDetails(
                 compartment_id=target_compartment_id,
             )
@@ -357,8 +537,6 @@ def update_database_insight(
         client = get_opsi_client()
 
         try:
-            from oci.opsi.models import UpdateDatabaseInsightDetails
-
             update_details = UpdateDatabaseInsightDetails(
                 freeform_tags=freeform_tags,
                 defined_tags=defined_tags,
@@ -406,16 +584,25 @@ def get_database_details_from_ocid(
         Dictionary containing database details.
     """
     try:
-        import oci
-
-        config = oci.config.from_file()
-        database_client = oci.database.DatabaseClient(config)
+        database_client = _get_database_client()
+
+        # Probe both endpoints concurrently: for non-autonomous databases
+        # this hides the autonomous probe's failure round-trip instead of
+        # paying for it sequentially
+        adb_future = get_shared_executor().submit(
+            database_client.get_autonomous_database,
+            autonomous_database_id=database_id,
+        )
+        db_future = get_shared_executor().submit(
+            database_client.get_database,
+            database_id=database_id,
+        )
 
-        # Try to get as autonomous database first
+        # Prefer the autonomous result when both succeed
         try:
-            response = database_client.get_autonomous_database(
-                autonomous_database_id=database_id,
-            )
+            response = adb_future.result()
+            # Swallow the loser's exception so it is not logged as unhandled
+            db_future.add_done_callback(lambda f: f.exception())
 
             db = response.data
             return {
@@ -432,15 +619,13 @@ def get_database_details_from_ocid(
                 "is_dedicated": getattr(db, "is_dedicated", None),
                 "subnet_id": getattr(db, "subnet_id", None),
                 "connection_strings": getattr(db, "connection_strings", {}) if hasattr(db, "connection_strings") else {},
-                "time_created": str(db.time_created),
+                "time_created": _iso(db.time_created),
                 "database_type": "AUTONOMOUS_DATABASE",
             }
 
-        except:
-            # Try as regular database
-            response = database_client.get_database(
-                database_id=database_id,
-            )
+        except Exception:
+            # Not autonomous - use the regular database probe
+            response = db_future.result()
 
             db = response.data
             return {
@@ -451,7 +636,7 @@ def get_database_details_from_ocid(
                 "db_version": getattr(db, "db_version", None),
                 "db_home_id": db.db_home_id,
                 "db_system_id": getattr(db, "db_system_id", None),
-                "time_created": str(db.time_created),
+                "time_created": _iso(db.time_created),
                 "database_type": "DATABASE",
             }
 
@@ -1,14 +1,123 @@
 """FastMCP tools for OCI Database Management comprehensive operations."""
 
+import logging
+import operator
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any, Optional
 
-from .oci_clients import get_dbm_client, list_all, extract_region_from_ocid
+from .oci_clients import (
+    get_dbm_client,
+    get_shared_executor,
+    list_all,
+    list_all_generator,
+    extract_region_from_ocid,
+)
+
+logger = logging.getLogger(__name__)
+
+# Field tuples + C-level attrgetters for hot row-building loops
+_MDB_FIELDS = (
+    "id",
+    "name",
+    "database_type",
+    "database_sub_type",
+    "deployment_type",
+    "management_option",
+    "workload_type",
+    "is_cluster",
+    "lifecycle_state",
+    "time_created",
+)
+_MDB_GET = operator.attrgetter(*_MDB_FIELDS)
+
+_SNAP_FIELDS = (
+    "snapshot_id",
+    "instance_number",
+    "time_snapshot_begin",
+    "time_snapshot_end",
+    "time_db_startup",
+    "snapshot_identifier",
+)
+_SNAP_GET = operator.attrgetter(*_SNAP_FIELDS)
+
+
+def _iso(dt: Any) -> Optional[str]:
+    """Serialize a datetime via its C-level isoformat(); None stays None."""
+    return dt.isoformat() if dt is not None else None
+
+
+@dataclass(slots=True)
+class ManagedDBRow:
+    """Compact accumulator row for list_managed_databases.
+
+    Slots avoid the per-row __dict__ allocation while pages stream in;
+    the JSON-ready dict is only built at the response boundary.
+    """
+
+    id: Optional[str]
+    name: Optional[str]
+    database_type: Optional[str]
+    database_sub_type: Optional[str]
+    deployment_type: Optional[str]
+    management_option: Optional[str]
+    workload_type: Optional[str]
+    is_cluster: Optional[bool]
+    lifecycle_state: Optional[str]
+    time_created: Any
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "database_type": self.database_type,
+            "database_sub_type": self.database_sub_type,
+            "deployment_type": self.deployment_type,
+            "management_option": self.management_option,
+            "workload_type": self.workload_type,
+            "is_cluster": self.is_cluster,
+            "lifecycle_state": self.lifecycle_state,
+            "time_created": _iso(self.time_created),
+        }
+
+
+@dataclass(slots=True)
+class SnapshotRow:
+    """Compact accumulator row for list_awr_db_snapshots."""
+
+    snapshot_id: Optional[int]
+    instance_number: Optional[int]
+    time_snapshot_begin: Any
+    time_snapshot_end: Any
+    time_db_startup: Any
+    snapshot_identifier: Optional[int]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "snapshot_id": self.snapshot_id,
+            "instance_number": self.instance_number,
+            "time_snapshot_begin": _iso(self.time_snapshot_begin),
+            "time_snapshot_end": _iso(self.time_snapshot_end),
+            "time_db_startup": _iso(self.time_db_startup),
+            "snapshot_identifier": self.snapshot_identifier,
+        }
+
+
+# TTL cache for fleet health metrics: agents re-request the same
+# compartment within seconds, and HOUR-granularity metrics tolerate 30s
+# of staleness
+_FLEET_CACHE: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+_FLEET_CACHE_LOCK = threading.Lock()
+_FLEET_CACHE_TTL_SECONDS = 30.0
 
 
 def list_managed_databases(
     compartment_id: str,
     lifecycle_state: Optional[str] = None,
     name: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
     """
     List all managed databases in a compartment.
@@ -17,6 +126,8 @@ def list_managed_databases(
         compartment_id: Compartment OCID to query.
         lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE").
         name: Filter by database name.
+        limit: Optional maximum number of databases to return; pagination
+               stops as soon as the limit is reached.
 
     Returns:
         Dictionary containing list of managed databases with their details.
@@ -30,26 +141,19 @@ def list_managed_databases(
         if name:
             kwargs["name"] = name
 
-        # Use list_all for automatic pagination
-        managed_dbs = list_all(
-            client.list_managed_databases,
-            **kwargs,
-        )
+        # Stream pages instead of accumulating all SDK objects up front;
+        # only compact slot-based rows are held while paginating
+        rows: list[ManagedDBRow] = []
+        for db in list_all_generator(client.list_managed_databases, **kwargs):
+            if limit is not None and len(rows) >= limit:
+                break
+            try:
+                rows.append(ManagedDBRow(*_MDB_GET(db)))
+            except AttributeError:
+                # Older SDK models may lack some fields - fall back per-field
+                rows.append(ManagedDBRow(*(getattr(db, field, None) for field in _MDB_FIELDS)))
 
-        items = []
-        for db in managed_dbs:
-            items.append({
-                "id": db.id,
-                "name": db.name,
-                "database_type": getattr(db, "database_type", None),
-                "database_sub_type": getattr(db, "database_sub_type", None),
-                "deployment_type": getattr(db, "deployment_type", None),
-                "management_option": getattr(db, "management_option", None),
-                "workload_type": getattr(db, "workload_type", None),
-                "is_cluster": getattr(db, "is_cluster", None),
-                "lifecycle_state": db.lifecycle_state,
-                "time_created": str(db.time_created),
-            })
+        items = [row.as_dict() for row in rows]
 
         return {
             "compartment_id": compartment_id,
@@ -78,11 +182,12 @@ def get_managed_database(database_id: str) -> dict[str, Any]:
     Returns:
         Dictionary containing detailed managed database information.
     """
+    # Detect region from database OCID (cached string parse, safe outside try)
+    region = extract_region_from_ocid(database_id)
+
     try:
-        # Detect region from database OCID
-        region = extract_region_from_ocid(database_id)
         if region:
-            print(f"Detected database region: {region}")
+            logger.debug("Detected database region: %s", region)
 
         client = get_dbm_client(region=region)
 
@@ -102,7 +207,7 @@ def get_managed_database(database_id: str) -> dict[str, Any]:
             "database_version": getattr(db, "database_version", None),
             "is_cluster": getattr(db, "is_cluster", None),
             "lifecycle_state": db.lifecycle_state,
-            "time_created": str(db.time_created),
+            "time_created": _iso(db.time_created),
             "additional_details": getattr(db, "additional_details", {}),
         }
 
@@ -138,9 +243,8 @@ def get_managed_database(database_id: str) -> dict[str, Any]:
                 ]
             }
 
-            detected_region = extract_region_from_ocid(database_id)
-            if detected_region:
-                error_result["detected_database_region"] = detected_region
+            if region:
+                error_result["detected_database_region"] = region
 
         return error_result
 
@@ -165,29 +269,22 @@ def get_tablespace_usage(
             managed_database_id=database_id,
         )
 
+        # Canonical iteration: collection responses expose .items, raw
+        # responses are already a list
+        rows = getattr(response.data, "items", response.data) or []
+
         tablespaces = []
-        if hasattr(response.data, "items"):
-            for ts in response.data.items:
-                tablespaces.append({
-                    "name": getattr(ts, "name", None),
-                    "type": getattr(ts, "type", None),
-                    "status": getattr(ts, "status", None),
-                    "block_size_bytes": getattr(ts, "block_size_bytes", None),
-                    "size_in_mbs": getattr(ts, "size_in_mbs", None),
-                    "used_in_mbs": getattr(ts, "used_in_mbs", None),
-                    "used_percent": getattr(ts, "used_percent", None),
-                    "is_default": getattr(ts, "is_default", None),
-                })
-        elif isinstance(response.data, list):
-            for ts in response.data:
-                tablespaces.append({
-                    "name": getattr(ts, "name", None),
-                    "type": getattr(ts, "type", None),
-                    "status": getattr(ts, "status", None),
-                    "size_in_mbs": getattr(ts, "size_in_mbs", None),
-                    "used_in_mbs": getattr(ts, "used_in_mbs", None),
-                    "used_percent": getattr(ts, "used_percent", None),
-                })
+        for ts in rows:
+            tablespaces.append({
+                "name": getattr(ts, "name", None),
+                "type": getattr(ts, "type", None),
+                "status": getattr(ts, "status", None),
+                "block_size_bytes": getattr(ts, "block_size_bytes", None),
+                "size_in_mbs": getattr(ts, "size_in_mbs", None),
+                "used_in_mbs": getattr(ts, "used_in_mbs", None),
+                "used_percent": getattr(ts, "used_percent", None),
+                "is_default": getattr(ts, "is_default", None),
+            })
 
         return {
             "database_id": database_id,
@@ -233,21 +330,22 @@ def get_database_parameters(
             **kwargs,
         )
 
+        rows = getattr(response.data, "items", response.data) or []
+
         parameters = []
-        if hasattr(response.data, "items"):
-            for param in response.data.items:
-                param_dict = {
-                    "name": getattr(param, "name", None),
-                    "type": getattr(param, "type", None),
-                    "value": getattr(param, "value", None),
-                    "display_value": getattr(param, "display_value", None),
-                    "is_modified": getattr(param, "is_modified", None),
-                    "is_default": getattr(param, "is_default", None),
-                    "description": getattr(param, "description", None),
-                }
-                if is_allowed_values_included:
-                    param_dict["allowed_values"] = getattr(param, "allowed_values", [])
-                parameters.append(param_dict)
+        for param in rows:
+            param_dict = {
+                "name": getattr(param, "name", None),
+                "type": getattr(param, "type", None),
+                "value": getattr(param, "value", None),
+                "display_value": getattr(param, "display_value", None),
+                "is_modified": getattr(param, "is_modified", None),
+                "is_default": getattr(param, "is_default", None),
+                "description": getattr(param, "description", None),
+            }
+            if is_allowed_values_included:
+                param_dict["allowed_values"] = getattr(param, "allowed_values", [])
+            parameters.append(param_dict)
 
         return {
             "database_id": database_id,
@@ -263,25 +361,77 @@ def get_database_parameters(
         }
 
 
+def get_managed_database_overview(
+    database_id: str,
+    include: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """
+    Get database details, tablespace usage, and parameters in one call.
+
+    MCP clients routinely call get_managed_database, get_tablespace_usage,
+    and get_database_parameters back-to-back for the same database. This
+    tool fans the requested sections out concurrently, collapsing three
+    sequential round-trips into one.
+
+    Args:
+        database_id: Managed Database OCID.
+        include: Sections to fetch ("details", "tablespaces", "parameters").
+                 Defaults to all three.
+
+    Returns:
+        Dictionary with one key per requested section, each holding the
+        corresponding tool's result (including any per-section error).
+    """
+    section_funcs = {
+        "details": get_managed_database,
+        "tablespaces": get_tablespace_usage,
+        "parameters": get_database_parameters,
+    }
+    sections = include or list(section_funcs)
+
+    futures = {
+        section: get_shared_executor().submit(section_funcs[section], database_id)
+        for section in sections
+        if section in section_funcs
+    }
+
+    result: dict[str, Any] = {"database_id": database_id}
+    for section, future in futures.items():
+        result[section] = future.result()
+
+    unknown = [s for s in sections if s not in section_funcs]
+    if unknown:
+        result["ignored_sections"] = unknown
+
+    return result
+
+
 def get_awr_db_report(
     database_id: str,
     awr_db_id: str,
     begin_snapshot_id: int,
     end_snapshot_id: int,
     report_format: str = "HTML",
+    inline: bool = False,
 ) -> dict[str, Any]:
     """
     Get AWR (Automatic Workload Repository) report for a managed database.
 
+    AWR HTML reports can be several MB. By default the report content is
+    written to a temporary file and only its path is returned, so the
+    blob is not materialized twice (Python string + JSON-RPC encoding).
+
     Args:
         database_id: Managed Database OCID.
         awr_db_id: AWR database ID.
         begin_snapshot_id: Begin snapshot identifier.
         end_snapshot_id: End snapshot identifier.
         report_format: Report format (HTML or TEXT).
+        inline: If True, return the report content inline under "report"
+                instead of spooling it to a file.
 
     Returns:
-        Dictionary containing AWR report data.
+        Dictionary containing the report file path and size (or inline content).
     """
     try:
         client = get_dbm_client()
@@ -294,15 +444,34 @@ def get_awr_db_report(
             report_format=report_format,
         )
 
-        return {
+        result = {
             "database_id": database_id,
             "awr_db_id": awr_db_id,
             "begin_snapshot_id": begin_snapshot_id,
             "end_snapshot_id": end_snapshot_id,
             "report_format": report_format,
-            "report": str(response.data) if hasattr(response, "data") else None,
         }
 
+        data = getattr(response, "data", None)
+        content = getattr(data, "content", None)
+        if content is None and data is not None:
+            content = str(data)
+
+        if content is None:
+            result["report"] = None
+        elif inline:
+            result["report"] = content
+        else:
+            suffix = ".html" if report_format.upper() == "HTML" else ".txt"
+            with tempfile.NamedTemporaryFile(
+                "w", delete=False, prefix="awr_report_", suffix=suffix, encoding="utf-8"
+            ) as tmp:
+                tmp.write(content)
+                result["report_path"] = tmp.name
+                result["report_bytes"] = tmp.tell()
+
+        return result
+
     except Exception as e:
         return {
             "error": str(e),
@@ -346,16 +515,17 @@ def list_awr_db_snapshots(
             **kwargs,
         )
 
-        items = []
+        # A month of 10-minute snapshots is thousands of rows; one C-level
+        # attrgetter per row beats six Python-level getattr calls, and the
+        # slot-based rows skip per-row __dict__ allocation
+        rows: list[SnapshotRow] = []
         for snap in snapshots:
-            items.append({
-                "snapshot_id": getattr(snap, "snapshot_id", None),
-                "instance_number": getattr(snap, "instance_number", None),
-                "time_snapshot_begin": str(getattr(snap, "time_snapshot_begin", None)),
-                "time_snapshot_end": str(getattr(snap, "time_snapshot_end", None)),
-                "time_db_startup": str(getattr(snap, "time_db_startup", None)),
-                "snapshot_identifier": getattr(snap, "snapshot_identifier", None),
-            })
+            try:
+                rows.append(SnapshotRow(*_SNAP_GET(snap)))
+            except AttributeError:
+                rows.append(SnapshotRow(*(getattr(snap, field, None) for field in _SNAP_FIELDS)))
+
+        items = [row.as_dict() for row in rows]
 
         return {
             "database_id": database_id,
@@ -395,6 +565,13 @@ def get_database_fleet_health_metrics(
     Returns:
         Dictionary containing fleet health metrics.
     """
+    cache_key = (compartment_id, compare_type)
+    now = time.monotonic()
+    with _FLEET_CACHE_LOCK:
+        cached = _FLEET_CACHE.get(cache_key)
+        if cached and now - cached[0] < _FLEET_CACHE_TTL_SECONDS:
+            return cached[1]
+
     try:
         client = get_dbm_client()
 
@@ -415,6 +592,10 @@ def get_database_fleet_health_metrics(
                 "inventory": getattr(metrics, "fleet_summary", {}) if hasattr(metrics, "fleet_summary") else {},
             }
 
+        # Only cache successful responses
+        with _FLEET_CACHE_LOCK:
+            _FLEET_CACHE[cache_key] = (time.monotonic(), result)
+
         return result
 
     except Exception as e:
@@ -1,9 +1,230 @@
 """FastMCP tools for OCI Operations Insights."""
 
+import asyncio
+import base64
+import functools
+import operator
+import threading
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from .oci_clients import get_opsi_client, extract_region_from_ocid, get_ocid_resource_type
+from oci.exceptions import ServiceError
+
+from .oci_clients import (
+    get_opsi_client,
+    get_shared_executor,
+    extract_region_from_ocid,
+    get_ocid_resource_type,
+    list_all_generator,
+)
+
+
+def _error_dict(e: Exception, **extra: Any) -> dict[str, Any]:
+    """Build an error payload without stringifying the whole exception.
+
+    str() on a ServiceError formats the entire error body (headers,
+    request id, opc metadata); its status/code/message fields are already
+    broken out, so use them directly.
+    """
+    if isinstance(e, ServiceError):
+        payload: dict[str, Any] = {
+            "error": e.message,
+            "status": e.status,
+            "code": e.code,
+            "type": "ServiceError",
+        }
+    else:
+        payload = {"error": str(e), "type": type(e).__name__}
+    payload.update(extra)
+    return payload
+
+
+def _is_not_found(e: Exception) -> bool:
+    """True for 404 / NotAuthorizedOrNotFound, checked cheaply on ServiceError."""
+    if isinstance(e, ServiceError):
+        return e.status == 404 or e.code == "NotAuthorizedOrNotFound"
+    msg = str(e)
+    return "NotAuthorizedOrNotFound" in msg or "404" in msg
+
+# One-time probe for the newer query-data-object SDK surface
+try:
+    from oci.opsi.models import QueryDataObjectJsonResultSetDetails
+    _HAS_QUERY_MODEL = True
+except ImportError:
+    QueryDataObjectJsonResultSetDetails = None
+    _HAS_QUERY_MODEL = False
+
+# One-time probes for the SQL-text listing surface, checked on the client
+# class so no client instance is needed at import time
+try:
+    from oci.opsi import OperationsInsightsClient as _OpsiClientClass
+
+    _HAS_SUMMARIZE_SQL_STATS = hasattr(_OpsiClientClass, "summarize_sql_statistics")
+    _HAS_LIST_SQL_TEXTS = hasattr(_OpsiClientClass, "list_sql_texts")
+    _USE_NEW_QUERY_API = _HAS_QUERY_MODEL and hasattr(
+        _OpsiClientClass, "query_opsi_data_object_data"
+    )
+except ImportError:
+    _HAS_SUMMARIZE_SQL_STATS = True
+    _HAS_LIST_SQL_TEXTS = False
+    _USE_NEW_QUERY_API = False
+
+# Field tuple + C-level attrgetter for the database-insight row loop
+_DBI_FIELDS = (
+    "id",
+    "compartment_id",
+    "database_id",
+    "database_name",
+    "database_display_name",
+    "database_type",
+    "database_version",
+    "entity_source",
+    "processor_count",
+    "status",
+    "lifecycle_state",
+    "time_created",
+    "time_updated",
+    "freeform_tags",
+    "defined_tags",
+)
+_DBI_GET = operator.attrgetter(*_DBI_FIELDS)
+
+# Field tuple + attrgetter for the SQL-statistics row loop
+_SQL_KEYS = (
+    "sql_identifier",
+    "database_id",
+    "sql_text",
+    "executions_count",
+    "cpu_time_in_sec",
+    "elapsed_time_in_sec",
+    "buffer_gets",
+    "disk_reads",
+    "rows_processed",
+)
+_SQL_GET = operator.attrgetter(*_SQL_KEYS)
+
+
+def _sql_values(item) -> tuple:
+    """Fetch all SQL-stat fields in one C-level call, tolerating missing attrs."""
+    try:
+        return _SQL_GET(item)
+    except AttributeError:
+        return tuple(getattr(item, key, None) for key in _SQL_KEYS)
+
+# TTL cache for read-mostly listings that dashboards and agents re-poll
+# with identical filters many times per session
+_RESPONSE_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_TTL_SECONDS = 30.0
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+
+def _cache_get(key: tuple, max_age: Optional[int]) -> Optional[dict[str, Any]]:
+    """Return a cached response younger than max_age (default TTL), else None."""
+    ttl = _RESPONSE_CACHE_TTL_SECONDS if max_age is None else float(max_age)
+    if ttl <= 0:
+        return None
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+    return None
+
+
+def _cache_put(key: tuple, value: dict[str, Any]) -> None:
+    """Store a successful response, evicting the oldest entry when full."""
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+        _RESPONSE_CACHE[key] = (time.monotonic(), value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp, tolerating the trailing "Z" suffix.
+
+    Dashboard polling repeats the same time windows constantly, so the
+    parsed datetimes are memoized on the raw string.
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+
+def _bucket_time(timestamp: str, bucket_seconds: int):
+    """Round an ISO timestamp down to a bucket of epoch seconds.
+
+    Dashboard polls issue near-identical time windows that differ by a few
+    seconds of wall clock; bucketing collapses them onto one cache key.
+    Falls back to the raw string when the timestamp cannot be parsed.
+    """
+    if bucket_seconds <= 0:
+        return timestamp
+    try:
+        epoch = int(_parse_iso(timestamp).timestamp())
+    except (TypeError, ValueError):
+        return timestamp
+    return epoch // bucket_seconds * bucket_seconds
+
+
+# Row count below which Arrow encoding is not worth the conversion cost
+_ARROW_MIN_ROWS = 500
+
+
+def _rows_to_arrow(rows: list) -> Optional[dict[str, Any]]:
+    """
+    Encode row dicts as a base64 Arrow IPC stream.
+
+    Returns None when pyarrow is not installed (optional dependency);
+    callers fall back to the plain dict shape.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+    except ImportError:
+        return None
+
+    table = pa.Table.from_pylist(rows)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return {
+        "arrow_ipc_base64": base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii"),
+        "num_rows": table.num_rows,
+        "num_columns": table.num_columns,
+    }
+
+
+def _rows_to_columns(rows: list) -> dict[str, list]:
+    """
+    Transpose row dicts into a dict of column lists (AoS -> SoA).
+
+    Wide warehouse rows stored as one list per column roughly halve the
+    per-row dict overhead for large result sets.
+    """
+    if not rows or not isinstance(rows[0], dict):
+        return {"_rows": rows}
+    keys = list(rows[0])
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def _dbi_row(db_insight: Any) -> dict[str, Any]:
+    """Build one database-insight row dict via the attrgetter fast path."""
+    try:
+        row = dict(zip(_DBI_FIELDS, _DBI_GET(db_insight)))
+    except AttributeError:
+        row = {field: getattr(db_insight, field, None) for field in _DBI_FIELDS}
+    tc = row["time_created"]
+    tu = row["time_updated"]
+    row["time_created"] = tc.isoformat() if tc is not None else None
+    row["time_updated"] = tu.isoformat() if tu is not None else None
+    if row["freeform_tags"] is None:
+        row["freeform_tags"] = {}
+    if row["defined_tags"] is None:
+        row["defined_tags"] = {}
+    return row
 
 
 def list_database_insights(
@@ -11,15 +232,30 @@ def list_database_insights(
     lifecycle_state: Optional[str] = None,
     page: Optional[str] = None,
     limit: Optional[int] = None,
+    auto_paginate: bool = True,
+    max_items: int = 10000,
+    max_age: Optional[int] = None,
 ) -> dict[str, Any]:
     """
     List database insights in a compartment with optional filtering.
 
+    By default all pages are fetched with a large page size, so callers
+    no longer get a silently truncated first page when they forget to
+    chase the next_page token.
+
     Args:
         compartment_id: Compartment OCID to query.
         lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE", "DELETED").
         page: Page token for pagination (from previous response).
-        limit: Maximum number of items to return per page.
+        limit: Maximum number of items to return. With auto_paginate this
+               caps the total result; with auto_paginate=False it is the
+               page size for manual token paging.
+        auto_paginate: If True (default), follow opc_next_page tokens
+                       internally until the listing is exhausted.
+        max_items: Safety cap on the number of items fetched when
+                   auto-paginating.
+        max_age: Maximum cached-result age in seconds (default 30).
+                 Pass 0 to bypass the cache and always hit the service.
 
     Returns:
         Dictionary containing database insights list and pagination info.
@@ -32,64 +268,137 @@ def list_database_insights(
         ... )
         >>> print(f"Found {len(result['items'])} database insights")
     """
+    # Every parameter that changes the response shape must be in the key,
+    # or paginated and capped variants would serve each other's payloads
+    cache_key = (
+        "list_dbi", compartment_id, lifecycle_state, page, limit, auto_paginate, max_items
+    )
+    cached = _cache_get(cache_key, max_age)
+    if cached is not None:
+        return cached
+
     try:
         client = get_opsi_client()
 
+        # A caller-supplied limit keeps its historical meaning - a cap on
+        # the number of results - rather than silently becoming the page
+        # size while every page is drained anyway
+        cap = min(limit, max_items) if (auto_paginate and limit) else max_items
+
         kwargs = {"compartment_id": compartment_id}
 
         if lifecycle_state:
             kwargs["lifecycle_state"] = lifecycle_state
         if page:
             kwargs["page"] = page
-        if limit:
+        if auto_paginate:
+            # Large pages amortize the fixed per-round-trip cost
+            kwargs["limit"] = min(cap, 1000)
+        elif limit:
             kwargs["limit"] = limit
 
+        items = []
+        next_token = None
         response = client.list_database_insights(**kwargs)
+        while True:
+            # Prefetch the next page while this page is being converted,
+            # overlapping the HTTPS round-trip with row building. The
+            # remaining budget counts the current page and clamps the
+            # prefetch limit, so the cap is never overshot and the token
+            # surfaced below always resumes after the last item returned
+            next_token = getattr(response, "opc_next_page", None) or getattr(
+                response, "next_page", None
+            )
+            page_rows = response.data.items
+            pending = None
+            remaining = cap - len(items) - len(page_rows)
+            if auto_paginate and next_token and remaining > 0:
+                pending = get_shared_executor().submit(
+                    client.list_database_insights,
+                    **{**kwargs, "page": next_token, "limit": min(remaining, 1000)},
+                )
 
-        items = []
-        for db_insight in response.data.items:
-            items.append({
-                "id": db_insight.id,
-                "compartment_id": db_insight.compartment_id,
-                "database_id": db_insight.database_id,
-                "database_name": db_insight.database_name,
-                "database_display_name": getattr(db_insight, "database_display_name", None),
-                "database_type": db_insight.database_type,
-                "database_version": getattr(db_insight, "database_version", None),
-                "entity_source": getattr(db_insight, "entity_source", None),
-                "processor_count": getattr(db_insight, "processor_count", None),
-                "status": db_insight.status,
-                "lifecycle_state": db_insight.lifecycle_state,
-                "time_created": str(db_insight.time_created),
-                "time_updated": str(getattr(db_insight, "time_updated", None)),
-                "freeform_tags": getattr(db_insight, "freeform_tags", {}),
-                "defined_tags": getattr(db_insight, "defined_tags", {}),
-            })
+            for db_insight in page_rows:
+                items.append(_dbi_row(db_insight))
+
+            if pending is None:
+                break
+            response = pending.result()
 
         result = {
             "items": items,
             "count": len(items),
         }
 
-        # Add pagination info if available
-        if hasattr(response, "next_page") and response.next_page:
-            result["next_page"] = response.next_page
-        if hasattr(response, "opc_next_page") and response.opc_next_page:
-            result["next_page"] = response.opc_next_page
+        # Surface the token only when the listing was not exhausted
+        if next_token:
+            result["next_page"] = next_token
 
+        _cache_put(cache_key, result)
         return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-        }
+        return _error_dict(e)
+
+
+def iter_database_insights(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream database-insight rows one at a time instead of materializing a list.
+
+    Wraps the paginating generator from oci_clients, so peak memory stays at
+    O(page size) rather than O(total rows) on multi-page listings. Rows use
+    the same shape as list_database_insights.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE", "DELETED").
+        limit: Page size for each underlying request (default 1000).
+
+    Yields:
+        One database-insight dict per record.
+    """
+    client = get_opsi_client()
+
+    kwargs = {"compartment_id": compartment_id, "limit": limit or 1000}
+    if lifecycle_state:
+        kwargs["lifecycle_state"] = lifecycle_state
+
+    for db_insight in list_all_generator(client.list_database_insights, **kwargs):
+        yield _dbi_row(db_insight)
+
+
+async def list_database_insights_async(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+    page: Optional[str] = None,
+    limit: Optional[int] = None,
+    auto_paginate: bool = True,
+    max_items: int = 10000,
+    max_age: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Async variant of list_database_insights.
+
+    Runs the blocking OCI SDK call in a worker thread so concurrent MCP
+    tool calls are not serialized behind the event loop; N parallel calls
+    complete in roughly max(latency) instead of the sum.
+    """
+    return await asyncio.to_thread(
+        list_database_insights, compartment_id, lifecycle_state, page, limit,
+        auto_paginate, max_items, max_age,
+    )
 
 
 def query_warehouse_standard(
     compartment_id: str,
     statement: str,
     region: Optional[str] = None,
+    columnar: bool = False,
+    return_format: str = "dict",
 ) -> dict[str, Any]:
     """
     Execute a standard SQL query against the Operations Insights warehouse.
@@ -106,6 +415,14 @@ def query_warehouse_standard(
         statement: SQL query statement to execute against the warehouse.
         region: Optional region override. Use this if querying databases in a specific region.
                Example: "us-phoenix-1", "uk-london-1"
+        columnar: If True, return results as a dict of column lists
+                 ("columns") instead of per-row dicts ("items") - roughly
+                 half the memory for wide result sets.
+        return_format: "dict" (default) or "arrow". With "arrow", result
+                 sets of 500+ rows are returned as a base64 Arrow IPC
+                 stream (2-4x smaller for wide numeric rows); requires
+                 the optional pyarrow dependency, otherwise falls back to
+                 the dict shape.
 
     Returns:
         Dictionary containing query results with columns and rows.
@@ -145,11 +462,9 @@ def query_warehouse_standard(
 
         client = get_opsi_client(region=region)
 
-        # Try using the SDK method if available (newer SDK versions)
-        try:
-            # Attempt to use query_opsi_data_object_data method
-            from oci.opsi.models import QueryDataObjectJsonResultSetDetails
-
+        # Use the SDK method when the import-time probe found it; no
+        # exception-driven dispatch on the hot path
+        if _USE_NEW_QUERY_API:
             query_details = QueryDataObjectJsonResultSetDetails(
                 query_string=statement,
                 compartment_id=compartment_id,
@@ -162,12 +477,22 @@ def query_warehouse_standard(
 
             # Extract result data
             if hasattr(response.data, "items"):
-                return {
+                rows = [getattr(item, "__dict__", item) for item in response.data.items]
+                result = {
                     "query": statement,
                     "compartment_id": compartment_id,
-                    "items": [item.__dict__ if hasattr(item, "__dict__") else item for item in response.data.items],
-                    "count": len(response.data.items),
+                    "count": len(rows),
                 }
+                if return_format == "arrow" and len(rows) >= _ARROW_MIN_ROWS:
+                    arrow_payload = _rows_to_arrow(rows)
+                    if arrow_payload is not None:
+                        result["arrow"] = arrow_payload
+                        return result
+                if columnar:
+                    result["columns"] = _rows_to_columns(rows)
+                else:
+                    result["items"] = rows
+                return result
             else:
                 return {
                     "query": statement,
@@ -175,62 +500,63 @@ def query_warehouse_standard(
                     "data": response.data.__dict__ if hasattr(response.data, "__dict__") else str(response.data),
                 }
 
-        except (AttributeError, ImportError):
-            # Fall back to raw API call for older SDK versions
-            # Use the 20200630 API version with standard-query endpoint
-            path = "/20200630/opsiDataObjects/actions/queryData"
-
-            body = {
-                "queryString": statement,
-                "compartmentId": compartment_id,
-                "resultSetType": "JSON",
-            }
-
-            response = client.base_client.call_api(
-                resource_path=path,
-                method="POST",
-                body=body,
-                response_type="object",
-            )
+        # Fall back to raw API call for older SDK versions
+        # Use the 20200630 API version with standard-query endpoint
+        path = "/20200630/opsiDataObjects/actions/queryData"
 
-            # Parse the response
-            if response.status == 200:
-                data = response.data
+        body = {
+            "queryString": statement,
+            "compartmentId": compartment_id,
+            "resultSetType": "JSON",
+        }
 
-                # Extract columns and rows if present
-                result = {
-                    "query": statement,
-                    "compartment_id": compartment_id,
-                }
+        # "object" skips model-class deserialization and yields plain dicts
+        response = client.base_client.call_api(
+            resource_path=path,
+            method="POST",
+            body=body,
+            response_type="object",
+        )
+
+        # Parse the response
+        if response.status == 200:
+            data = response.data
+
+            # Extract columns and rows if present
+            result = {
+                "query": statement,
+                "compartment_id": compartment_id,
+            }
 
-                if hasattr(data, "items"):
-                    result["items"] = [
-                        item.__dict__ if hasattr(item, "__dict__") else item
-                        for item in data.items
-                    ]
-                    result["count"] = len(data.items)
-                elif isinstance(data, dict):
-                    result.update(data)
+            if isinstance(data, dict) and isinstance(data.get("items"), list):
+                rows = data["items"]
+                result["count"] = len(rows)
+                arrow_payload = None
+                if return_format == "arrow" and len(rows) >= _ARROW_MIN_ROWS:
+                    arrow_payload = _rows_to_arrow(rows)
+                if arrow_payload is not None:
+                    result["arrow"] = arrow_payload
+                elif columnar:
+                    result["columns"] = _rows_to_columns(rows)
                 else:
-                    result["data"] = str(data)
-
-                return result
+                    result["items"] = rows
+            elif isinstance(data, dict):
+                result.update(data)
             else:
-                return {
-                    "error": f"API call failed with status {response.status}",
-                    "query": statement,
-                }
+                result["data"] = str(data)
+
+            return result
+        else:
+            return {
+                "error": f"API call failed with status {response.status}",
+                "query": statement,
+            }
 
     except Exception as e:
-        error_msg = str(e)
-        error_result = {
-            "error": error_msg,
-            "type": type(e).__name__,
-            "query": statement,
-        }
+        error_result = _error_dict(e, query=statement)
 
         # Add troubleshooting guidance
-        if "NotAuthorizedOrNotFound" in error_msg or "404" in error_msg:
+        if _is_not_found(e):
             error_result["troubleshooting"] = {
                 "possible_causes": [
                     "OPSI warehouse not configured in this region",
@@ -255,18 +581,36 @@ def query_warehouse_standard(
         return error_result
 
 
+async def query_warehouse_standard_async(
+    compartment_id: str,
+    statement: str,
+    region: Optional[str] = None,
+    columnar: bool = False,
+    return_format: str = "dict",
+) -> dict[str, Any]:
+    """Async variant of query_warehouse_standard (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        query_warehouse_standard, compartment_id, statement, region, columnar, return_format
+    )
+
+
 def list_sql_texts(
     compartment_id: str,
     time_start: str,
     time_end: str,
     database_id: Optional[str] = None,
     sql_identifier: Optional[str] = None,
+    auto_paginate: bool = True,
+    max_items: int = 10000,
+    max_age: Optional[int] = None,
+    cache_bucket_seconds: int = 60,
 ) -> dict[str, Any]:
     """
     List SQL texts from Operations Insights for analysis.
 
     Retrieves SQL text data for database SQL statements within a time range,
-    useful for SQL performance analysis and tuning.
+    useful for SQL performance analysis and tuning. All result pages are
+    fetched by default (auto_paginate), capped at max_items.
 
     IMPORTANT: Operations Insights is regional. If querying a specific database,
     this function automatically detects the database region and queries the correct
@@ -279,6 +623,8 @@ def list_sql_texts(
         database_id: Optional database insight OCID to filter results.
                     Region will be automatically detected from this OCID.
         sql_identifier: Optional SQL identifier to retrieve specific SQL text.
+        cache_bucket_seconds: Bucket width used to normalize the time window
+                    in the response-cache key; 0 disables bucketing.
 
     Returns:
         Dictionary containing SQL text data with statistics.
@@ -299,6 +645,20 @@ def list_sql_texts(
         2. You have required IAM permissions for SQL statistics
         3. SQL Watch is enabled on the database (for ADW/ATP)
     """
+    cache_key = (
+        "sql_texts",
+        compartment_id,
+        _bucket_time(time_start, cache_bucket_seconds),
+        _bucket_time(time_end, cache_bucket_seconds),
+        database_id,
+        sql_identifier,
+        auto_paginate,
+        max_items,
+    )
+    cached = _cache_get(cache_key, max_age)
+    if cached is not None:
+        return cached
+
     try:
         # Validate OCID type if database_id provided
         if database_id:
@@ -351,9 +711,9 @@ def list_sql_texts(
         # Create region-aware client
         client = get_opsi_client(region=region)
 
-        # Convert time strings to datetime objects for API
-        time_interval_start = datetime.fromisoformat(time_start.replace("Z", "+00:00"))
-        time_interval_end = datetime.fromisoformat(time_end.replace("Z", "+00:00"))
+        # Convert time strings to datetime objects for API (cached parse)
+        time_interval_start = _parse_iso(time_start)
+        time_interval_end = _parse_iso(time_end)
 
         kwargs = {
             "compartment_id": compartment_id,
@@ -366,114 +726,122 @@ def list_sql_texts(
         if sql_identifier:
             kwargs["sql_identifier"] = [sql_identifier]
 
-        # Try to use summarize_sql_statistics (most common method)
-        try:
+        # Dispatch on the one-time capability probes instead of raising
+        # AttributeError per tier on every call
+        if _HAS_SUMMARIZE_SQL_STATS:
+            items = []
             response = client.summarize_sql_statistics(**kwargs)
+            while True:
+                # Prefetch the next page while converting this one
+                next_token = getattr(response, "opc_next_page", None) or getattr(
+                    response, "next_page", None
+                )
+                pending = None
+                if auto_paginate and next_token and len(items) < max_items:
+                    pending = get_shared_executor().submit(
+                        client.summarize_sql_statistics, **{**kwargs, "page": next_token}
+                    )
+
+                if hasattr(response.data, "items"):
+                    items.extend(
+                        dict(zip(_SQL_KEYS, _sql_values(item))) for item in response.data.items
+                    )
+
+                if pending is None:
+                    break
+                response = pending.result()
+
+            result = {
+                "compartment_id": compartment_id,
+                "time_start": time_start,
+                "time_end": time_end,
+                "items": items,
+                "count": len(items),
+            }
+            _cache_put(cache_key, result)
+            return result
+
+        if _HAS_LIST_SQL_TEXTS:
+            # Alternative method on older SDKs
+            response = client.list_sql_texts(**kwargs)
 
             items = []
             if hasattr(response.data, "items"):
                 for item in response.data.items:
-                    sql_item = {
+                    items.append({
                         "sql_identifier": getattr(item, "sql_identifier", None),
-                        "database_id": getattr(item, "database_id", None),
                         "sql_text": getattr(item, "sql_text", None),
-                        "executions_count": getattr(item, "executions_count", None),
-                        "cpu_time_in_sec": getattr(item, "cpu_time_in_sec", None),
-                        "elapsed_time_in_sec": getattr(item, "elapsed_time_in_sec", None),
-                        "buffer_gets": getattr(item, "buffer_gets", None),
-                        "disk_reads": getattr(item, "disk_reads", None),
-                        "rows_processed": getattr(item, "rows_processed", None),
-                    }
-                    items.append(sql_item)
+                        "database_id": getattr(item, "database_id", None),
+                    })
+            elif isinstance(response.data, list):
+                items = [getattr(item, "__dict__", item) for item in response.data]
 
-            return {
+            result = {
                 "compartment_id": compartment_id,
                 "time_start": time_start,
                 "time_end": time_end,
                 "items": items,
                 "count": len(items),
             }
+            _cache_put(cache_key, result)
+            return result
 
-        except AttributeError:
-            # Try alternative method: list_sql_texts if available
-            try:
-                response = client.list_sql_texts(**kwargs)
-
-                items = []
-                if hasattr(response.data, "items"):
-                    for item in response.data.items:
-                        items.append({
-                            "sql_identifier": getattr(item, "sql_identifier", None),
-                            "sql_text": getattr(item, "sql_text", None),
-                            "database_id": getattr(item, "database_id", None),
-                        })
-                elif isinstance(response.data, list):
-                    items = [item.__dict__ if hasattr(item, "__dict__") else item for item in response.data]
-
-                return {
-                    "compartment_id": compartment_id,
-                    "time_start": time_start,
-                    "time_end": time_end,
-                    "items": items,
-                    "count": len(items),
-                }
-
-            except AttributeError:
-                # Fall back to raw API call
-                path = "/20200630/databaseInsights/sqlTexts"
+        # Fall back to raw API call
+        path = "/20200630/databaseInsights/sqlTexts"
 
-                query_params = {
-                    "compartmentId": compartment_id,
-                    "timeIntervalStart": time_start,
-                    "timeIntervalEnd": time_end,
-                }
-
-                if database_id:
-                    query_params["databaseId"] = database_id
-                if sql_identifier:
-                    query_params["sqlIdentifier"] = sql_identifier
+        query_params = {
+            "compartmentId": compartment_id,
+            "timeIntervalStart": time_start,
+            "timeIntervalEnd": time_end,
+        }
 
-                response = client.base_client.call_api(
-                    resource_path=path,
-                    method="GET",
-                    query_params=query_params,
-                    response_type="object",
-                )
+        if database_id:
+            query_params["databaseId"] = database_id
+        if sql_identifier:
+            query_params["sqlIdentifier"] = sql_identifier
+
+        # "object" skips model-class deserialization and yields plain dicts
+        response = client.base_client.call_api(
+            resource_path=path,
+            method="GET",
+            query_params=query_params,
+            response_type="object",
+        )
+
+        if response.status == 200:
+            data = response.data
+            items = []
 
-                if response.status == 200:
-                    data = response.data
-                    items = []
-
-                    if hasattr(data, "items"):
-                        items = [item.__dict__ if hasattr(item, "__dict__") else item for item in data.items]
-                    elif isinstance(data, list):
-                        items = data
-
-                    return {
-                        "compartment_id": compartment_id,
-                        "time_start": time_start,
-                        "time_end": time_end,
-                        "items": items,
-                        "count": len(items),
-                    }
+            if isinstance(data, dict):
+                items = data.get("items") or []
+            elif isinstance(data, list):
+                items = data
 
-                return {
-                    "error": f"API call failed with status {response.status}",
-                    "compartment_id": compartment_id,
-                }
+            result = {
+                "compartment_id": compartment_id,
+                "time_start": time_start,
+                "time_end": time_end,
+                "items": items,
+                "count": len(items),
+            }
+            _cache_put(cache_key, result)
+            return result
 
-    except Exception as e:
-        error_msg = str(e)
-        error_result = {
-            "error": error_msg,
-            "type": type(e).__name__,
+        return {
+            "error": f"API call failed with status {response.status}",
             "compartment_id": compartment_id,
-            "time_start": time_start,
-            "time_end": time_end,
         }
 
+    except Exception as e:
+        error_result = _error_dict(
+            e,
+            compartment_id=compartment_id,
+            time_start=time_start,
+            time_end=time_end,
+        )
+
         # Add troubleshooting guidance for common errors
-        if "NotAuthorizedOrNotFound" in error_msg or "404" in error_msg:
+        if _is_not_found(e):
             error_result["troubleshooting"] = {
                 "possible_causes": [
                     "Database does not have Operations Insights enabled",
@@ -505,3 +873,51 @@ def list_sql_texts(
                     )
 
         return error_result
+
+
+async def list_sql_texts_async(
+    compartment_id: str,
+    time_start: str,
+    time_end: str,
+    database_id: Optional[str | list[str]] = None,
+    sql_identifier: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of list_sql_texts (blocking call off-loop).
+
+    database_id also accepts a list of OCIDs; the per-database calls then
+    fan out concurrently via asyncio.gather and the merged items complete
+    in roughly max(latency) instead of the sum.
+    """
+    if isinstance(database_id, list) and len(database_id) > 1:
+        results = await asyncio.gather(
+            *[
+                asyncio.to_thread(
+                    list_sql_texts, compartment_id, time_start, time_end, db, sql_identifier
+                )
+                for db in database_id
+            ]
+        )
+        items = []
+        errors = []
+        for db, result in zip(database_id, results):
+            if "error" in result:
+                errors.append({"database_id": db, "error": result["error"]})
+            else:
+                items.extend(result.get("items") or [])
+        merged = {
+            "compartment_id": compartment_id,
+            "time_start": time_start,
+            "time_end": time_end,
+            "database_ids": database_id,
+            "items": items,
+            "count": len(items),
+        }
+        if errors:
+            merged["errors"] = errors
+        return merged
+
+    if isinstance(database_id, list):
+        database_id = database_id[0] if database_id else None
+    return await asyncio.to_thread(
+        list_sql_texts, compartment_id, time_start, time_end, database_id, sql_identifier
+    )
@@ -1,15 +1,275 @@
 """FastMCP tools for diagnosing Operations Insights authorization and configuration issues."""
 
+import asyncio
+import functools
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from .oci_clients_enhanced import get_opsi_client, get_dbm_client, get_identity_client
 from ..config_enhanced import get_oci_config
 
+logger = logging.getLogger(__name__)
 
+# TTL cache for the top-level diagnostics: IAM and SQL Watch state changes
+# on the order of minutes, while dashboards re-poll every few seconds
+_DIAG_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_DIAG_CACHE_LOCK = threading.Lock()
+_DIAG_INFLIGHT: dict[tuple, threading.Event] = {}
+
+# Single case-folding scan over the error payload instead of two substring
+# checks plus a lowercased copy
+_AUTHZ_RE = re.compile(r"NotAuthorizedOrNotFound|authorization", re.IGNORECASE)
+
+_MISSING = object()
+
+
+def _obj_get(obj: Any, name: str, default: Any = None) -> Any:
+    """Read an attribute via the instance __dict__ fast path.
+
+    OCI SDK models store values under underscore-prefixed slots behind
+    property descriptors, so checking the __dict__ (plain and "_"-prefixed)
+    avoids the generic descriptor walk; plain getattr stays as the fallback.
+    """
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        if name in d:
+            return d[name]
+        value = d.get("_" + name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return getattr(obj, name, default)
+
+
+def _obj_has(obj: Any, name: str) -> bool:
+    """hasattr with the same __dict__ fast path as _obj_get."""
+    d = getattr(obj, "__dict__", None)
+    if d is not None and (name in d or "_" + name in d):
+        return True
+    return hasattr(obj, name)
+
+
+def _is_throttle(e: Exception) -> bool:
+    """True when the SDK error indicates service-side rate limiting."""
+    return getattr(e, "status", None) == 429 or getattr(e, "code", None) in (
+        "TooManyRequests",
+        "ServiceLimitExceeded",
+    )
+
+
+class _AdaptiveSemaphore:
+    """Bounded semaphore whose capacity adapts to service throttling (AIMD).
+
+    Starts at `initial` slots; every `growth_interval` consecutive successes
+    add one slot back up to `maximum`, while a throttled call halves the
+    capacity (never below 1). Shrinking is lazy — excess permits drain as
+    callers release — so no in-flight call is interrupted.
+    """
+
+    def __init__(self, initial: int = 8, maximum: int = 16, growth_interval: int = 100):
+        self._cond = threading.Condition()
+        self._capacity = initial
+        self._maximum = maximum
+        self._growth_interval = growth_interval
+        self._in_use = 0
+        self._successes = 0
+        self.throttled_count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Current number of permitted concurrent calls (for observability)."""
+        return self._capacity
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_use >= self._capacity:
+                self._cond.wait()
+            self._in_use += 1
+
+    def release(self, *, throttled: bool = False) -> None:
+        with self._cond:
+            self._in_use -= 1
+            if throttled:
+                self.throttled_count += 1
+                self._successes = 0
+                new_capacity = max(1, self._capacity // 2)
+                if new_capacity < self._capacity:
+                    self._capacity = new_capacity
+                    logger.warning(
+                        "OCI throttling detected; reducing API concurrency to %d",
+                        new_capacity,
+                    )
+            else:
+                self._successes += 1
+                if self._successes >= self._growth_interval and self._capacity < self._maximum:
+                    self._capacity += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+# Shared gate for the bulk per-database probes: bounds concurrent OCI calls
+# across all callers and backs off automatically on 429s
+_OPSI_API_SLOTS = _AdaptiveSemaphore(initial=8)
+
+
+def _ttl_cache(seconds: float = 60.0):
+    """Cache a diagnostic function's result per argument tuple for `seconds`.
+
+    Concurrent identical calls are coalesced singleflight-style: the first
+    caller computes while the rest wait on an Event and read the cached
+    result. Callers can force a recompute with refresh=True; error results
+    (success=False) are never cached.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, refresh: bool = False, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            while True:
+                with _DIAG_CACHE_LOCK:
+                    if not refresh:
+                        entry = _DIAG_CACHE.get(key)
+                        if entry is not None and time.monotonic() - entry[0] < seconds:
+                            return entry[1]
+                    event = _DIAG_INFLIGHT.get(key)
+                    if event is None:
+                        event = threading.Event()
+                        _DIAG_INFLIGHT[key] = event
+                        break
+                # Another caller is already computing this key; wait for it,
+                # then re-read the cache
+                event.wait()
+                refresh = False
+            try:
+                result = fn(*args, **kwargs)
+                if result.get("success", True):
+                    with _DIAG_CACHE_LOCK:
+                        _DIAG_CACHE[key] = (time.monotonic(), result)
+                return result
+            finally:
+                with _DIAG_CACHE_LOCK:
+                    _DIAG_INFLIGHT.pop(key, None)
+                event.set()
+
+        return wrapper
+
+    return decorator
+
+
+def _probe_basic_read(opsi_client, compartment_id: str):
+    """Probe OPSI_DATABASE_INSIGHT_READ; returns (test entry, required policy or None)."""
+    try:
+        opsi_client.list_database_insights(
+            compartment_id=compartment_id,
+            limit=1
+        )
+        return {
+            "operation": "list_database_insights",
+            "status": "✓ ALLOWED",
+            "allowed": True,
+            "permission": "OPSI_DATABASE_INSIGHT_READ",
+            "level": "basic"
+        }, None
+    except Exception as e:
+        return {
+            "operation": "list_database_insights",
+            "status": "✗ DENIED",
+            "allowed": False,
+            "error": str(e),
+            "permission": "OPSI_DATABASE_INSIGHT_READ",
+            "level": "basic"
+        }, "Allow group <your-group> to read opsi-database-insights in compartment <your-compartment>"
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_time_window(minute_bucket: int) -> tuple[str, str]:
+    """ISO window for the SQL-stats probe, cached per wall-clock minute.
+
+    The probe only checks authorization (limit=1), so a small 5-minute
+    window is enough, and calls within the same minute reuse the formatted
+    strings instead of re-allocating datetimes.
+    """
+    time_end = datetime.fromtimestamp(minute_bucket * 60, tz=timezone.utc)
+    time_start = time_end - timedelta(minutes=5)
+    return time_start.isoformat(), time_end.isoformat()
+
+
+def _probe_sql_stats(opsi_client, compartment_id: str):
+    """Probe OPSI_WAREHOUSE_DATA_OBJECT_READ; returns (test entry, required policy or None)."""
+    try:
+        time_start, time_end = _probe_time_window(int(time.time() // 60))
+
+        opsi_client.summarize_sql_statistics(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            limit=1
+        )
+        return {
+            "operation": "summarize_sql_statistics",
+            "status": "✓ ALLOWED",
+            "allowed": True,
+            "permission": "OPSI_WAREHOUSE_DATA_OBJECT_READ",
+            "level": "sql-insights"
+        }, None
+    except Exception as e:
+        error_msg = str(e)
+        required = None
+        if _AUTHZ_RE.search(error_msg):
+            required = "Allow group <your-group> to read opsi-warehouse-data-objects in compartment <your-compartment>"
+        return {
+            "operation": "summarize_sql_statistics",
+            "status": "✗ DENIED",
+            "allowed": False,
+            "error": error_msg,
+            "permission": "OPSI_WAREHOUSE_DATA_OBJECT_READ",
+            "level": "sql-insights"
+        }, required
+
+
+def _probe_warehouse_query(opsi_client, compartment_id: str):
+    """Probe OPSI_DATA_OBJECTS_QUERY; returns (test entry, required policy or None)."""
+    try:
+        opsi_client.query_opsi_data_objects(
+            compartment_id=compartment_id,
+            query_opsi_data_object_data_details={
+                "compartmentId": compartment_id,
+                "dataObjectType": "HOST_INSIGHTS_DATA_OBJECT",
+                "query": "SELECT 1 FROM dual"
+            }
+        )
+        return {
+            "operation": "query_opsi_data_objects",
+            "status": "✓ ALLOWED",
+            "allowed": True,
+            "permission": "OPSI_DATA_OBJECTS_QUERY",
+            "level": "advanced"
+        }, None
+    except Exception as e:
+        error_msg = str(e)
+        required = None
+        if _AUTHZ_RE.search(error_msg):
+            required = "Allow group <your-group> to use opsi-data-objects in compartment <your-compartment>"
+        return {
+            "operation": "query_opsi_data_objects",
+            "status": "✗ DENIED",
+            "allowed": False,
+            "error": error_msg,
+            "permission": "OPSI_DATA_OBJECTS_QUERY",
+            "level": "advanced"
+        }, required
+
+
+@_ttl_cache(seconds=60)
 def diagnose_opsi_permissions(
     compartment_id: str,
     profile: Optional[str] = None,
+    skip_dependents: bool = True,
 ) -> dict[str, Any]:
     """
     Diagnose Operations Insights IAM permissions and identify missing policies.
@@ -20,6 +280,9 @@ def diagnose_opsi_permissions(
     Args:
         compartment_id: Compartment OCID to test permissions in
         profile: OCI profile name for multi-tenancy support
+        skip_dependents: If True (default), skip the SQL-level and advanced
+            probes when basic read is already denied - they cannot succeed,
+            so this saves two denied round-trips
 
     Returns:
         Dictionary with permission test results and recommendations
@@ -37,91 +300,52 @@ def diagnose_opsi_permissions(
 
         test_results = []
         required_permissions = []
-
-        # Test 1: List database insights (basic read)
-        try:
-            opsi_client.list_database_insights(
-                compartment_id=compartment_id,
-                limit=1
-            )
-            test_results.append({
-                "operation": "list_database_insights",
-                "status": "✓ ALLOWED",
-                "permission": "OPSI_DATABASE_INSIGHT_READ",
-                "level": "basic"
-            })
-        except Exception as e:
-            test_results.append({
-                "operation": "list_database_insights",
-                "status": "✗ DENIED",
-                "error": str(e),
-                "permission": "OPSI_DATABASE_INSIGHT_READ",
-                "level": "basic"
-            })
-            required_permissions.append("Allow group <your-group> to read opsi-database-insights in compartment <your-compartment>")
-
-        # Test 2: Summarize SQL statistics (SQL-level insights)
-        try:
-            time_end = datetime.utcnow()
-            time_start = time_end - timedelta(days=1)
-
-            opsi_client.summarize_sql_statistics(
-                compartment_id=compartment_id,
-                time_interval_start=time_start.isoformat(),
-                time_interval_end=time_end.isoformat(),
-                limit=1
-            )
-            test_results.append({
-                "operation": "summarize_sql_statistics",
-                "status": "✓ ALLOWED",
-                "permission": "OPSI_WAREHOUSE_DATA_OBJECT_READ",
-                "level": "sql-insights"
-            })
-        except Exception as e:
-            error_msg = str(e)
-            test_results.append({
-                "operation": "summarize_sql_statistics",
-                "status": "✗ DENIED",
-                "error": error_msg,
-                "permission": "OPSI_WAREHOUSE_DATA_OBJECT_READ",
-                "level": "sql-insights"
-            })
-
-            if "NotAuthorizedOrNotFound" in error_msg or "authorization" in error_msg.lower():
-                required_permissions.append("Allow group <your-group> to read opsi-warehouse-data-objects in compartment <your-compartment>")
-
-        # Test 3: Query warehouse (advanced SQL queries)
-        try:
-            opsi_client.query_opsi_data_objects(
-                compartment_id=compartment_id,
-                query_opsi_data_object_data_details={
-                    "compartmentId": compartment_id,
-                    "dataObjectType": "HOST_INSIGHTS_DATA_OBJECT",
-                    "query": "SELECT 1 FROM dual"
-                }
-            )
-            test_results.append({
-                "operation": "query_opsi_data_objects",
-                "status": "✓ ALLOWED",
-                "permission": "OPSI_DATA_OBJECTS_QUERY",
-                "level": "advanced"
-            })
-        except Exception as e:
-            error_msg = str(e)
-            test_results.append({
-                "operation": "query_opsi_data_objects",
-                "status": "✗ DENIED",
-                "error": error_msg,
-                "permission": "OPSI_DATA_OBJECTS_QUERY",
-                "level": "advanced"
-            })
-
-            if "NotAuthorizedOrNotFound" in error_msg or "authorization" in error_msg.lower():
-                required_permissions.append("Allow group <your-group> to use opsi-data-objects in compartment <your-compartment>")
-
-        # Determine overall status
-        allowed_count = sum(1 for t in test_results if "✓" in t["status"])
-        denied_count = sum(1 for t in test_results if "✗" in t["status"])
+        allowed_count = 0
+        denied_count = 0
+
+        # The SDK exposes no bulk authorization-check endpoint, so the probes
+        # stay exception-driven - but they are independent, so issue them
+        # concurrently and pay one round-trip of wall time instead of three
+        basic_entry, basic_required = _probe_basic_read(opsi_client, compartment_id)
+        test_results.append(basic_entry)
+        if basic_entry["allowed"]:
+            allowed_count += 1
+        else:
+            denied_count += 1
+        if basic_required:
+            required_permissions.append(basic_required)
+
+        if skip_dependents and not basic_entry["allowed"]:
+            # The SQL-level and advanced probes cannot succeed without basic
+            # read; synthesize their rows instead of burning two denied calls
+            for operation, permission, level in (
+                ("summarize_sql_statistics", "OPSI_WAREHOUSE_DATA_OBJECT_READ", "sql-insights"),
+                ("query_opsi_data_objects", "OPSI_DATA_OBJECTS_QUERY", "advanced"),
+            ):
+                test_results.append({
+                    "operation": operation,
+                    "status": "✗ SKIPPED (basic read denied)",
+                    "allowed": False,
+                    "skipped": True,
+                    "permission": permission,
+                    "level": level
+                })
+                denied_count += 1
+        else:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                probe_futures = [
+                    pool.submit(_probe_sql_stats, opsi_client, compartment_id),
+                    pool.submit(_probe_warehouse_query, opsi_client, compartment_id),
+                ]
+                for future in probe_futures:
+                    entry, required = future.result()
+                    test_results.append(entry)
+                    if entry["allowed"]:
+                        allowed_count += 1
+                    else:
+                        denied_count += 1
+                    if required:
+                        required_permissions.append(required)
 
         return {
             "compartment_id": compartment_id,
@@ -150,24 +374,42 @@ def diagnose_opsi_permissions(
 
 def generate_permission_recommendations(test_results: list) -> list[str]:
     """Generate actionable permission recommendations based on test results."""
-    recommendations = []
-
-    # Check what's failing
-    denied_operations = [t for t in test_results if "✗" in t["status"]]
+    # One pass over the results; only these booleans are ever used
+    basic_denied = False
+    sql_denied = False
+    advanced_denied = False
+    for t in test_results:
+        if t.get("allowed", "✗" not in t["status"]):
+            continue
+        if t["operation"] == "list_database_insights":
+            basic_denied = True
+        if t["level"] == "sql-insights":
+            sql_denied = True
+        elif t["level"] == "advanced":
+            advanced_denied = True
+
+    return list(_permission_recs(basic_denied, sql_denied, advanced_denied))
+
+
+@functools.lru_cache(maxsize=8)
+def _permission_recs(
+    basic_denied: bool, sql_denied: bool, advanced_denied: bool
+) -> tuple[str, ...]:
+    """Recommendation text for a denial signature; pure, so memoized."""
+    if not (basic_denied or sql_denied or advanced_denied):
+        return ("✓ All tested permissions are working correctly",)
 
-    if not denied_operations:
-        recommendations.append("✓ All tested permissions are working correctly")
-        return recommendations
+    recommendations = []
 
     # Basic read permissions
-    if any(t["operation"] == "list_database_insights" for t in denied_operations):
+    if basic_denied:
         recommendations.append(
             "CRITICAL: Missing basic read permissions. Add policy:\n"
             "  Allow group <YourGroup> to read opsi-database-insights in compartment <YourCompartment>"
         )
 
     # SQL-level insights
-    if any(t["level"] == "sql-insights" for t in denied_operations):
+    if sql_denied:
         recommendations.append(
             "IMPORTANT: Missing SQL-level insights permissions. Add policies:\n"
             "  Allow group <YourGroup> to read opsi-warehouse-data-objects in compartment <YourCompartment>\n"
@@ -175,7 +417,7 @@ def generate_permission_recommendations(test_results: list) -> list[str]:
         )
 
     # Advanced permissions
-    if any(t["level"] == "advanced" for t in denied_operations):
+    if advanced_denied:
         recommendations.append(
             "OPTIONAL: Missing advanced query permissions. Add policy:\n"
             "  Allow group <YourGroup> to use opsi-data-objects in compartment <YourCompartment>"
@@ -187,13 +429,174 @@ def generate_permission_recommendations(test_results: list) -> list[str]:
         "  Allow group <YourGroup> to manage operations-insights-family in compartment <YourCompartment>"
     )
 
-    return recommendations
+    return tuple(recommendations)
+
+
+# Slotted row type for the bulk loops: ~7 dict-key allocations saved per
+# database, converted to a dict only at the JSON boundary
+@dataclass(slots=True)
+class SqlWatchRow:
+    database_id: str
+    database_name: str
+    database_type: str
+    sqlwatch_status: str
+    sqlwatch_enabled: bool
+    em_managed: bool
+    status: str
+    error: Optional[str] = None
+
+    def as_dict(self) -> dict[str, Any]:
+        row = {
+            "database_id": self.database_id,
+            "database_name": self.database_name,
+            "database_type": self.database_type,
+            "sqlwatch_status": self.sqlwatch_status,
+            "sqlwatch_enabled": self.sqlwatch_enabled,
+            "em_managed": self.em_managed,
+            "status": self.status,
+        }
+        if self.error is not None:
+            row["error"] = self.error
+        return row
+
+
+@dataclass(slots=True)
+class InsightConfigRow:
+    database_id: str
+    database_name: str
+    database_display_name: str
+    database_type: str
+    entity_source: str
+    status: str
+    lifecycle_state: str
+    issues: list
+    configuration_status: str
+    em_managed: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "database_id": self.database_id,
+            "database_name": self.database_name,
+            "database_display_name": self.database_display_name,
+            "database_type": self.database_type,
+            "entity_source": self.entity_source,
+            "status": self.status,
+            "lifecycle_state": self.lifecycle_state,
+            "issues": self.issues,
+            "configuration_status": self.configuration_status,
+            "em_managed": self.em_managed,
+        }
+
+
+def _sqlwatch_probe(dbm_client, db) -> SqlWatchRow:
+    """Fetch SQL Watch status for one managed database, never raising."""
+    _OPSI_API_SLOTS.acquire()
+    throttled = False
+    try:
+        response = dbm_client.get_sql_watch_status(
+            managed_database_id=db.id
+        )
+
+        is_enabled = response.data.status == "ENABLED"
+
+        return SqlWatchRow(
+            database_id=db.id,
+            database_name=db.name,
+            database_type=_obj_get(db, "database_type", "Unknown"),
+            sqlwatch_status=response.data.status,
+            sqlwatch_enabled=is_enabled,
+            em_managed=_obj_get(db, "management_option") == "ADVANCED",
+            status="✓ Enabled" if is_enabled else "✗ Disabled",
+        )
+
+    except Exception as e:
+        throttled = _is_throttle(e)
+        return SqlWatchRow(
+            database_id=db.id,
+            database_name=db.name,
+            database_type=_obj_get(db, "database_type", "Unknown"),
+            sqlwatch_status="ERROR",
+            sqlwatch_enabled=False,
+            em_managed=False,
+            status="⚠ Error",
+            error=str(e),
+        )
+    finally:
+        _OPSI_API_SLOTS.release(throttled=throttled)
+
+
+def iter_sqlwatch_status(
+    compartment_id: str,
+    profile: Optional[str] = None,
+    lifecycle_state: str = "ACTIVE",
+    max_concurrency: int = 10,
+):
+    """
+    Stream per-database SQL Watch status dicts as each probe completes.
+
+    Unlike check_sqlwatch_status_bulk this does not buffer the whole
+    compartment: the managed-database listing is consumed page by page and
+    rows are yielded in completion order, so first results arrive while
+    later probes are still in flight and peak memory stays bounded.
+
+    Args:
+        compartment_id: Compartment OCID
+        profile: OCI profile name for multi-tenancy support
+        lifecycle_state: Filter by lifecycle state (default: ACTIVE)
+        max_concurrency: Upper bound on parallel status probes (default: 10)
+
+    Yields:
+        One status dict per managed database (same shape as the rows in
+        check_sqlwatch_status_bulk's "databases" list).
+    """
+    for row in _iter_sqlwatch_rows(compartment_id, profile, lifecycle_state, max_concurrency):
+        yield row.as_dict()
+
+
+def _iter_sqlwatch_rows(
+    compartment_id: str,
+    profile: Optional[str],
+    lifecycle_state: str,
+    max_concurrency: int,
+):
+    """Yield SqlWatchRow instances as probes complete.
+
+    The in-flight window is bounded at max_concurrency: the listing
+    generator is consumed only as probe slots free up, so peak memory
+    stays O(window) rather than O(fleet) even on huge compartments.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    from .oci_clients_enhanced import list_all_generator
 
+    dbm_client = get_dbm_client(profile=profile)
 
+    managed_dbs = list_all_generator(
+        dbm_client.list_managed_databases,
+        compartment_id=compartment_id,
+        lifecycle_state=lifecycle_state
+    )
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        pending = set()
+        for db in managed_dbs:
+            pending.add(pool.submit(_sqlwatch_probe, dbm_client, db))
+            if len(pending) >= max_concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+@_ttl_cache(seconds=60)
 def check_sqlwatch_status_bulk(
     compartment_id: str,
     profile: Optional[str] = None,
     lifecycle_state: str = "ACTIVE",
+    max_concurrency: int = 10,
 ) -> dict[str, Any]:
     """
     Check SQL Watch status across all managed databases in a compartment.
@@ -205,6 +608,8 @@ def check_sqlwatch_status_bulk(
         compartment_id: Compartment OCID
         profile: OCI profile name for multi-tenancy support
         lifecycle_state: Filter by lifecycle state (default: ACTIVE)
+        max_concurrency: Upper bound on parallel status probes; keep modest
+            to stay clear of per-service rate limits (default: 10)
 
     Returns:
         Dictionary with SQL Watch status for each database
@@ -218,57 +623,25 @@ def check_sqlwatch_status_bulk(
         >>> print(f"SQL Watch disabled: {result['summary']['disabled_count']}")
     """
     try:
-        dbm_client = get_dbm_client(profile=profile)
-
-        # List all managed databases
-        from .oci_clients_enhanced import list_all
-
-        managed_dbs = list_all(
-            dbm_client.list_managed_databases,
-            compartment_id=compartment_id,
-            lifecycle_state=lifecycle_state
-        )
-
-        results = []
+        # Thin wrapper: drain the streaming variant and tally the counters
+        # on slotted rows, converting to dicts once at the JSON boundary
+        rows = []
         enabled_count = 0
         disabled_count = 0
         error_count = 0
 
-        for db in managed_dbs:
-            try:
-                # Check SQL Watch status
-                response = dbm_client.get_sql_watch_status(
-                    managed_database_id=db.id
-                )
-
-                is_enabled = response.data.status == "ENABLED"
-
-                results.append({
-                    "database_id": db.id,
-                    "database_name": db.name,
-                    "database_type": getattr(db, "database_type", "Unknown"),
-                    "sqlwatch_status": response.data.status,
-                    "sqlwatch_enabled": is_enabled,
-                    "em_managed": getattr(db, "management_option", None) == "ADVANCED",
-                    "status": "✓ Enabled" if is_enabled else "✗ Disabled"
-                })
-
-                if is_enabled:
-                    enabled_count += 1
-                else:
-                    disabled_count += 1
-
-            except Exception as e:
-                results.append({
-                    "database_id": db.id,
-                    "database_name": db.name,
-                    "database_type": getattr(db, "database_type", "Unknown"),
-                    "sqlwatch_status": "ERROR",
-                    "sqlwatch_enabled": False,
-                    "error": str(e),
-                    "status": "⚠ Error"
-                })
+        for row in _iter_sqlwatch_rows(
+            compartment_id, profile, lifecycle_state, max_concurrency
+        ):
+            rows.append(row)
+            if row.sqlwatch_status == "ERROR":
                 error_count += 1
+            elif row.sqlwatch_enabled:
+                enabled_count += 1
+            else:
+                disabled_count += 1
+
+        results = [row.as_dict() for row in rows]
 
         return {
             "compartment_id": compartment_id,
@@ -278,7 +651,9 @@ def check_sqlwatch_status_bulk(
                 "enabled_count": enabled_count,
                 "disabled_count": disabled_count,
                 "error_count": error_count,
-                "enabled_percentage": (enabled_count / len(results) * 100) if results else 0
+                "enabled_percentage": (enabled_count / len(results) * 100) if results else 0,
+                "api_concurrency": _OPSI_API_SLOTS.capacity,
+                "api_throttled_count": _OPSI_API_SLOTS.throttled_count
             },
             "databases": results,
             "recommendations": generate_sqlwatch_recommendations(results),
@@ -297,30 +672,41 @@ def check_sqlwatch_status_bulk(
 
 def generate_sqlwatch_recommendations(database_results: list) -> list[str]:
     """Generate recommendations based on SQL Watch status."""
-    recommendations = []
-
-    disabled_dbs = [db for db in database_results if not db.get("sqlwatch_enabled")]
-    em_managed = [db for db in disabled_dbs if db.get("em_managed")]
-
-    if not disabled_dbs:
-        recommendations.append("✓ SQL Watch is enabled on all databases")
-        return recommendations
-
-    recommendations.append(
-        f"⚠ SQL Watch is disabled on {len(disabled_dbs)} database(s)"
-    )
-
-    if em_managed:
+    # One pass over the results; only the counts are ever used, so skip the
+    # three intermediate list allocations
+    disabled_count = 0
+    em_count = 0
+    for db in database_results:
+        if not db.get("sqlwatch_enabled"):
+            disabled_count += 1
+            if db.get("em_managed"):
+                em_count += 1
+
+    return list(_sqlwatch_recs(disabled_count, em_count, disabled_count - em_count))
+
+
+@functools.lru_cache(maxsize=128)
+def _sqlwatch_recs(
+    disabled_count: int, em_count: int, non_em_count: int
+) -> tuple[str, ...]:
+    """Recommendation text for a SQL Watch count signature; pure, so memoized."""
+    if not disabled_count:
+        return ("✓ SQL Watch is enabled on all databases",)
+
+    recommendations = [
+        f"⚠ SQL Watch is disabled on {disabled_count} database(s)"
+    ]
+
+    if em_count:
         recommendations.append(
-            f"\n{len(em_managed)} EM-managed database(s) require SQL Watch enablement:\n"
+            f"\n{em_count} EM-managed database(s) require SQL Watch enablement:\n"
             "  For EM-managed databases, SQL Watch must be enabled through Enterprise Manager\n"
             "  or using the enable_sqlwatch() tool with proper credentials"
         )
 
-    non_em = [db for db in disabled_dbs if not db.get("em_managed")]
-    if non_em:
+    if non_em_count:
         recommendations.append(
-            f"\n{len(non_em)} non-EM database(s) can be enabled using:\n"
+            f"\n{non_em_count} non-EM database(s) can be enabled using:\n"
             "  enable_sqlwatch_bulk() tool"
         )
 
@@ -332,9 +718,10 @@ def generate_sqlwatch_recommendations(database_results: list) -> list[str]:
         "  - Advanced performance analytics"
     )
 
-    return recommendations
+    return tuple(recommendations)
 
 
+@_ttl_cache(seconds=60)
 def check_database_insights_configuration(
     compartment_id: str,
     profile: Optional[str] = None,
@@ -373,7 +760,7 @@ def check_database_insights_configuration(
             lifecycle_state="ACTIVE"
         )
 
-        results = []
+        rows = []
         fully_configured = 0
         issues_found = 0
 
@@ -385,36 +772,36 @@ def check_database_insights_configuration(
                 issues.append(f"Status is {insight.status}, not ENABLED")
 
             # Check entity source (should be EM or MDS for EM-managed)
-            entity_source = getattr(insight, "entity_source", "Unknown")
+            entity_source = _obj_get(insight, "entity_source", "Unknown")
             if entity_source == "EM_MANAGED_EXTERNAL_DATABASE":
                 # This is EM-managed, check additional requirements
-                if not hasattr(insight, "enterprise_manager_identifier"):
+                if not _obj_has(insight, "enterprise_manager_identifier"):
                     issues.append("Missing Enterprise Manager identifier")
-                if not hasattr(insight, "enterprise_manager_bridge_id"):
+                if not _obj_has(insight, "enterprise_manager_bridge_id"):
                     issues.append("Missing Enterprise Manager bridge configuration")
 
             # Check for SQL collection features
             # Note: Some attributes may not be available depending on database type
-            db_info = {
-                "database_id": insight.id,
-                "database_name": insight.database_name,
-                "database_display_name": getattr(insight, "database_display_name", insight.database_name),
-                "database_type": insight.database_type,
-                "entity_source": entity_source,
-                "status": insight.status,
-                "lifecycle_state": insight.lifecycle_state,
-                "issues": issues,
-                "configuration_status": "✓ Fully Configured" if not issues else "⚠ Issues Found",
-                "em_managed": entity_source == "EM_MANAGED_EXTERNAL_DATABASE"
-            }
-
-            results.append(db_info)
+            rows.append(InsightConfigRow(
+                database_id=insight.id,
+                database_name=insight.database_name,
+                database_display_name=_obj_get(insight, "database_display_name", insight.database_name),
+                database_type=insight.database_type,
+                entity_source=entity_source,
+                status=insight.status,
+                lifecycle_state=insight.lifecycle_state,
+                issues=issues,
+                configuration_status="✓ Fully Configured" if not issues else "⚠ Issues Found",
+                em_managed=entity_source == "EM_MANAGED_EXTERNAL_DATABASE",
+            ))
 
             if not issues:
                 fully_configured += 1
             else:
                 issues_found += 1
 
+        results = [row.as_dict() for row in rows]
+
         return {
             "compartment_id": compartment_id,
             "profile": profile,
@@ -443,16 +830,22 @@ def generate_insights_recommendations(database_results: list) -> list[str]:
     """Generate recommendations based on database insights configuration."""
     recommendations = []
 
-    em_managed = [db for db in database_results if db.get("em_managed")]
-    issues = [db for db in database_results if db.get("issues")]
+    # Single pass: only the counts matter, so skip the intermediate lists
+    em_managed_count = 0
+    issues_count = 0
+    for db in database_results:
+        if db.get("em_managed"):
+            em_managed_count += 1
+        if db.get("issues"):
+            issues_count += 1
 
-    if not issues:
+    if not issues_count:
         recommendations.append("✓ All database insights are fully configured")
         return recommendations
 
-    if em_managed:
+    if em_managed_count:
         recommendations.append(
-            f"⚠ {len(em_managed)} EM-managed database(s) detected\n"
+            f"⚠ {em_managed_count} EM-managed database(s) detected\n"
             "\nFor EM-managed databases, ensure:\n"
             "1. Enterprise Manager bridge is properly configured\n"
             "2. EM agent is running and can communicate with OCI\n"
@@ -472,6 +865,12 @@ def generate_insights_recommendations(database_results: list) -> list[str]:
     return recommendations
 
 
+# Singleflight registry: concurrent identical comprehensive runs share one
+# in-flight computation instead of each issuing its own 3-phase probe
+_COMPREHENSIVE_INFLIGHT: dict[tuple, Future] = {}
+_COMPREHENSIVE_INFLIGHT_LOCK = threading.Lock()
+
+
 def get_comprehensive_diagnostics(
     compartment_id: str,
     profile: Optional[str] = None,
@@ -480,7 +879,8 @@ def get_comprehensive_diagnostics(
     Run comprehensive diagnostics for Operations Insights SQL analytics issues.
 
     This combines all diagnostic checks to provide a complete picture of
-    configuration and permission issues.
+    configuration and permission issues. Concurrent calls for the same
+    compartment/profile are coalesced onto a single in-flight run.
 
     Args:
         compartment_id: Compartment OCID
@@ -496,73 +896,122 @@ def get_comprehensive_diagnostics(
         ... )
         >>> print(result['action_plan'])
     """
-    try:
-        print("Running comprehensive diagnostics...")
-
-        # 1. Check IAM permissions
-        print("  1/3 Checking IAM permissions...")
-        perm_result = diagnose_opsi_permissions(compartment_id, profile)
-
-        # 2. Check SQL Watch status
-        print("  2/3 Checking SQL Watch status...")
-        sqlwatch_result = check_sqlwatch_status_bulk(compartment_id, profile)
+    key = (compartment_id, profile)
+    with _COMPREHENSIVE_INFLIGHT_LOCK:
+        existing = _COMPREHENSIVE_INFLIGHT.get(key)
+        if existing is not None:
+            leader_future = None
+        else:
+            leader_future = Future()
+            _COMPREHENSIVE_INFLIGHT[key] = leader_future
+
+    if leader_future is None:
+        # Another caller is already running this diagnostic; share its result
+        return existing.result()
 
-        # 3. Check database insights configuration
-        print("  3/3 Checking database insights configuration...")
-        insights_result = check_database_insights_configuration(compartment_id, profile)
-
-        # Generate action plan
+    try:
+        result = _comprehensive_diagnostics_impl(compartment_id, profile)
+        leader_future.set_result(result)
+        return result
+    except BaseException as e:
+        leader_future.set_exception(e)
+        raise
+    finally:
+        with _COMPREHENSIVE_INFLIGHT_LOCK:
+            _COMPREHENSIVE_INFLIGHT.pop(key, None)
+
+
+def _comprehensive_diagnostics_impl(
+    compartment_id: str,
+    profile: Optional[str] = None,
+) -> dict[str, Any]:
+    """Run the three diagnostic phases and assemble the action plan."""
+    try:
+        logger.debug("Running comprehensive diagnostics (3 checks in parallel)")
+
+        # The three sub-checks hit independent services (OPSI, DBM), so run
+        # them concurrently; wall-clock drops from sum() to ~max() of the
+        # phases. A failing probe still surfaces partial diagnostics.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {
+                "permissions": pool.submit(diagnose_opsi_permissions, compartment_id, profile),
+                "sqlwatch": pool.submit(check_sqlwatch_status_bulk, compartment_id, profile),
+                "insights": pool.submit(
+                    check_database_insights_configuration, compartment_id, profile
+                ),
+            }
+            phase_results = {}
+            for name, future in futures.items():
+                try:
+                    phase_results[name] = future.result()
+                except Exception as e:
+                    phase_results[name] = {
+                        "error": str(e),
+                        "type": type(e).__name__,
+                        "success": False,
+                    }
+
+        perm_result = phase_results["permissions"]
+        sqlwatch_result = phase_results["sqlwatch"]
+        insights_result = phase_results["insights"]
+
+        # Destructure each nested summary once; all counters below read from
+        # these local dicts instead of repeated .get("summary", {}) chains
+        perm_sum = perm_result.get("summary") or {}
+        sw_sum = sqlwatch_result.get("summary") or {}
+        ins_sum = insights_result.get("summary") or {}
+
+        denied = perm_sum.get("denied", 0)
+        disabled_count = sw_sum.get("disabled_count", 0)
+        config_issues = ins_sum.get("issues_found", 0)
+
+        # One loop builds the action plan; adding a category is a single
+        # tuple of (category, severity, count, issue, actions)
         action_plan = []
-        priority = 1
-
-        # Permission issues (highest priority)
-        if perm_result.get("summary", {}).get("denied", 0) > 0:
-            action_plan.append({
-                "priority": priority,
-                "category": "IAM Permissions",
-                "issue": f"{perm_result['summary']['denied']} permission(s) denied",
-                "actions": perm_result.get("required_permissions", []),
-                "severity": "CRITICAL"
-            })
-            priority += 1
-
-        # SQL Watch issues
-        disabled_count = sqlwatch_result.get("summary", {}).get("disabled_count", 0)
-        if disabled_count > 0:
-            action_plan.append({
-                "priority": priority,
-                "category": "SQL Watch",
-                "issue": f"SQL Watch disabled on {disabled_count} database(s)",
-                "actions": [
+        categories = (
+            (
+                "IAM Permissions",
+                "CRITICAL",
+                denied,
+                f"{denied} permission(s) denied",
+                perm_result.get("required_permissions", []),
+            ),
+            (
+                "SQL Watch",
+                "HIGH",
+                disabled_count,
+                f"SQL Watch disabled on {disabled_count} database(s)",
+                [
                     "Use enable_sqlwatch_bulk() to enable SQL Watch on eligible databases",
                     "For EM-managed databases, enable SQL Watch through Enterprise Manager"
                 ],
-                "severity": "HIGH"
-            })
-            priority += 1
+            ),
+            (
+                "Configuration",
+                "MEDIUM",
+                config_issues,
+                f"{config_issues} database(s) with configuration issues",
+                insights_result.get("recommendations", []),
+            ),
+        )
 
-        # Configuration issues
-        config_issues = insights_result.get("summary", {}).get("issues_found", 0)
-        if config_issues > 0:
+        overall_status = "HEALTHY"
+        for category, severity, count, issue, actions in categories:
+            if count <= 0:
+                continue
             action_plan.append({
-                "priority": priority,
-                "category": "Configuration",
-                "issue": f"{config_issues} database(s) with configuration issues",
-                "actions": insights_result.get("recommendations", []),
-                "severity": "MEDIUM"
+                "priority": len(action_plan) + 1,
+                "category": category,
+                "issue": issue,
+                "actions": actions,
+                "severity": severity
             })
-            priority += 1
-
-        # Overall status
-        overall_status = "HEALTHY"
-        if len(action_plan) > 0:
-            severities = [item["severity"] for item in action_plan]
-            if "CRITICAL" in severities:
-                overall_status = "CRITICAL_ISSUES"
-            elif "HIGH" in severities:
-                overall_status = "HIGH_PRIORITY_ISSUES"
-            else:
-                overall_status = "MINOR_ISSUES"
+            if overall_status == "HEALTHY":
+                # Categories are ordered by severity, so the first hit wins
+                overall_status = {
+                    "CRITICAL": "CRITICAL_ISSUES",
+                    "HIGH": "HIGH_PRIORITY_ISSUES",
+                }.get(severity, "MINOR_ISSUES")
 
         return {
             "compartment_id": compartment_id,
@@ -575,11 +1024,11 @@ def get_comprehensive_diagnostics(
             },
             "action_plan": action_plan,
             "summary": {
-                "total_databases": insights_result.get("summary", {}).get("total_insights", 0),
-                "permission_issues": perm_result.get("summary", {}).get("denied", 0),
+                "total_databases": ins_sum.get("total_insights", 0),
+                "permission_issues": denied,
                 "sqlwatch_disabled": disabled_count,
                 "configuration_issues": config_issues,
-                "em_managed_databases": insights_result.get("summary", {}).get("em_managed_count", 0)
+                "em_managed_databases": ins_sum.get("em_managed_count", 0)
             },
             "success": True
         }
@@ -592,3 +1041,36 @@ def get_comprehensive_diagnostics(
             "profile": profile,
             "success": False
         }
+
+
+async def diagnose_opsi_permissions_async(
+    compartment_id: str,
+    profile: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of diagnose_opsi_permissions (blocking call off-loop)."""
+    return await asyncio.to_thread(diagnose_opsi_permissions, compartment_id, profile)
+
+
+async def check_sqlwatch_status_bulk_async(
+    compartment_id: str,
+    profile: Optional[str] = None,
+    lifecycle_state: str = "ACTIVE",
+    max_concurrency: int = 10,
+) -> dict[str, Any]:
+    """Async variant of check_sqlwatch_status_bulk (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        check_sqlwatch_status_bulk, compartment_id, profile, lifecycle_state, max_concurrency
+    )
+
+
+async def get_comprehensive_diagnostics_async(
+    compartment_id: str,
+    profile: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of get_comprehensive_diagnostics.
+
+    The sync orchestrator already fans its three phases out on a thread
+    pool, so off-loading the whole call keeps the event loop free while
+    retaining the phase-level parallelism and singleflight coalescing.
+    """
+    return await asyncio.to_thread(get_comprehensive_diagnostics, compartment_id, profile)
@@ -1,16 +1,513 @@
 """Extended FastMCP tools for OCI Operations Insights - Host, SQL, and Capacity."""
 
-from datetime import datetime
+import asyncio
+import functools
+import heapq
+import operator
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 import oci
+from oci.exceptions import ServiceError
 
 from .oci_clients import get_opsi_client, list_all, extract_region_from_ocid, get_ocid_resource_type
+from ..cache import DatabaseCache
+
+try:
+    # Optional C parser (analytics extra): ~4x faster than the stdlib path
+    import ciso8601
+
+    @functools.lru_cache(maxsize=256)
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp string to an aware datetime.
+
+        Memoized: agents reuse the same time window across many calls.
+        """
+        return ciso8601.parse_datetime(value)
+
+except ImportError:
+
+    @functools.lru_cache(maxsize=256)
+    def _parse_iso(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp string to an aware datetime.
+
+        Memoized: agents reuse the same time window across many calls.
+        """
+        try:
+            # Python 3.11+ accepts a trailing "Z" natively
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Field tuples + attrgetters for the hot row-building loops; one C-level
+# call replaces the 4-11 Python-level getattr lookups per row
+_HOST_KEYS = (
+    "id",
+    "host_name",
+    "host_display_name",
+    "host_type",
+    "platform_type",
+    "processor_count",
+    "status",
+    "lifecycle_state",
+    "time_created",
+)
+_HOST_GET = operator.attrgetter(*_HOST_KEYS)
+
+_EXA_KEYS = (
+    "id",
+    "exadata_name",
+    "exadata_display_name",
+    "exadata_type",
+    "status",
+    "lifecycle_state",
+    "time_created",
+)
+_EXA_GET = operator.attrgetter(*_EXA_KEYS)
+
+_SQL_STAT_KEYS = (
+    "executions_count",
+    "executions_per_hour",
+    "cpu_time_in_sec",
+    "io_time_in_sec",
+    "database_time_in_sec",
+    "database_time_pct",
+    "inefficient_wait_time_in_sec",
+    "response_time_in_sec",
+    "average_active_sessions",
+    "plan_count",
+    "variability",
+)
+_SQL_STAT_GET = operator.attrgetter(*_SQL_STAT_KEYS)
+
+_CAPACITY_KEYS = ("end_timestamp", "capacity", "usage", "utilization_percent")
+_CAPACITY_GET = operator.attrgetter(*_CAPACITY_KEYS)
+
+_FORECAST_KEYS = ("end_timestamp", "usage", "high_value", "low_value")
+_FORECAST_GET = operator.attrgetter(*_FORECAST_KEYS)
+
+_HOST_STAT_KEYS = (
+    "resource_name",
+    "usage",
+    "capacity",
+    "utilization_percent",
+    "usage_change_percent",
+)
+_HOST_STAT_GET = operator.attrgetter(*_HOST_STAT_KEYS)
+
+
+def _error_dict(e: Exception, **extra: Any) -> dict[str, Any]:
+    """Structured error payload matching the module's error shape.
+
+    ServiceError is matched explicitly so expected service-side failures
+    (404s, throttles) keep their status and code without paying for the
+    generic stringification path.
+    """
+    if isinstance(e, ServiceError):
+        err: dict[str, Any] = {
+            "error": e.message,
+            "status": e.status,
+            "code": e.code,
+            "type": "ServiceError",
+        }
+    else:
+        err = {"error": str(e), "type": type(e).__name__}
+    err.update(extra)
+    return err
+
+
+def _nn(**kwargs: Any) -> dict[str, Any]:
+    """Drop None-valued kwargs so SDK filters can be passed inline."""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _as_list(value) -> Optional[list]:
+    """Wrap a scalar filter in a list; lists pass through, falsy becomes None.
+
+    OCI list filters take list parameters; normalizing once here means a
+    caller passing a list is not silently double-wrapped.
+    """
+    if not value:
+        return None
+    return value if isinstance(value, list) else [value]
+
+
+def _iso(dt) -> Optional[datetime]:
+    """None-safe pass-through for a timestamp destined for the wire.
+
+    The response serializer renders datetimes as ISO-8601 directly in C,
+    so stringifying here would only add a Python-level isoformat() per
+    field. None stays None instead of becoming the string 'None'.
+    """
+    return dt
+
+
+def _row_values(get, keys: tuple, obj) -> tuple:
+    """Fetch all row fields in one C-level call, tolerating missing attrs."""
+    try:
+        return get(obj)
+    except AttributeError:
+        return tuple(getattr(obj, key, None) for key in keys)
+
+
+def _host_row(host) -> dict[str, Any]:
+    """Response row for one host insight."""
+    row = dict(zip(_HOST_KEYS, _row_values(_HOST_GET, _HOST_KEYS, host)))
+    row["time_created"] = _iso(row["time_created"])
+    return row
+
+
+def _exa_row(exadata) -> dict[str, Any]:
+    """Response row for one Exadata insight."""
+    row = dict(zip(_EXA_KEYS, _row_values(_EXA_GET, _EXA_KEYS, exadata)))
+    row["time_created"] = _iso(row["time_created"])
+    return row
+
+
+def _percentile_summary(values: list) -> dict[str, Any]:
+    """Scalar p50/p95/max/count stats for a metric series.
+
+    Lets summary_only callers answer "what's the p95?" without the cost of
+    materializing and shipping one dict per data point.
+    """
+    if not values:
+        return {"count": 0}
+    if len(values) == 1:
+        return {"p50": values[0], "p95": values[0], "max": values[0], "count": 1}
+    q = statistics.quantiles(values, n=100)
+    return {"p50": q[49], "p95": q[94], "max": max(values), "count": len(values)}
+
+
+def _ts(dt, fmt: str):
+    """Timestamp in the requested wire format, None-safe.
 
+    "epoch_ms" emits an int64 (8 bytes, no downstream re-parse, no JSON
+    string escaping); the default "iso" passes the datetime through for
+    the serializer to render as ISO-8601 in C.
+    """
+    if dt is None:
+        return None
+    if fmt == "epoch_ms":
+        return int(dt.timestamp() * 1000)
+    return dt
+
+
+def _capacity_row(item, timestamp_format: str = "iso") -> dict[str, Any]:
+    """Response row for one capacity-trend data point."""
+    end_ts, capacity, usage, util = _row_values(_CAPACITY_GET, _CAPACITY_KEYS, item)
+    return {
+        "end_timestamp": _ts(end_ts, timestamp_format),
+        "capacity": capacity,
+        "usage": usage,
+        "utilization_percent": util,
+    }
+
+
+def _forecast_row(item, timestamp_format: str = "iso") -> dict[str, Any]:
+    """Response row for one forecast data point."""
+    end_ts, usage, high, low = _row_values(_FORECAST_GET, _FORECAST_KEYS, item)
+    return {
+        "end_timestamp": _ts(end_ts, timestamp_format),
+        "usage": usage,
+        "high_value": high,
+        "low_value": low,
+    }
+
+
+_SQL_ROW_KEYS = (
+    "sql_identifier",
+    "database_id",
+    "database_name",
+    "database_display_name",
+    "category",
+)
+
+
+def _sql_stat_columns(items_src) -> dict[str, list]:
+    """Columnar (SoA) layout for large SQL summaries: one list per field.
+
+    Thousands of row dicts carry far more allocation and encode overhead
+    than a handful of parallel lists, so callers that post-process in bulk
+    can opt into this shape instead.
+    """
+    keys = _SQL_ROW_KEYS + _SQL_STAT_KEYS
+    columns: dict[str, list] = {key: [] for key in keys}
+    for item in items_src:
+        row = _sql_stat_row(item)
+        for key in keys:
+            columns[key].append(row.get(key))
+    return columns
+
+
+def _sql_stat_row(item) -> dict[str, Any]:
+    """Response row for one SQL-statistics item, with nested details flattened."""
+    details = getattr(item, "database_details", None)
+    statistics = getattr(item, "statistics", None)
+
+    row = {
+        "sql_identifier": getattr(item, "sql_identifier", None),
+        "database_id": getattr(details, "id", None),
+        "database_name": getattr(details, "database_name", None),
+        "database_display_name": getattr(details, "database_display_name", None),
+        "category": getattr(item, "category", None),
+    }
+    if statistics:
+        row.update(zip(
+            _SQL_STAT_KEYS,
+            _row_values(_SQL_STAT_GET, _SQL_STAT_KEYS, statistics),
+        ))
+    return row
+
+# Valid resource metrics per endpoint family; rejecting a typo locally
+# saves the full HTTPS round trip the service would spend returning 400
+_DB_METRICS = frozenset({"CPU", "STORAGE", "MEMORY", "IO"})
+_HOST_METRICS = frozenset({"CPU", "MEMORY", "NETWORK", "STORAGE", "LOGICAL_MEMORY"})
+
+
+def _metric_error(resource_metric: str, valid: frozenset) -> dict[str, Any]:
+    """Error dict for a resource_metric outside `valid`."""
+    return {
+        "error": f"Invalid resource_metric: {resource_metric!r}",
+        "type": "ValueError",
+        "valid_values": sorted(valid),
+    }
+
+
+# TTL response cache: the tools below are idempotent reads whose results
+# change slowly (plans are immutable, forecasts update hourly) while agents
+# repeat identical calls many times per turn. Expired entries are refreshed
+# inline on the next call; error results are never cached.
+_TTL_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_TTL_CACHE_LOCK = threading.Lock()
+_TTL_CACHE_MAX_ENTRIES = 512
+
+# Single-flight: identical calls arriving while one is already on the wire
+# wait for that call's result instead of issuing their own OCI request
+_INFLIGHT: dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _ttl_cache(seconds: float):
+    """Cache a tool's successful result per argument tuple for `seconds`.
+
+    Decorated tools gain a ``bypass_cache`` keyword: pass True to skip the
+    lookup and force a live OCI call (the fresh result is still stored).
+    Concurrent identical calls are coalesced: the first becomes the leader
+    and issues the OCI request; the rest block on its future, so a burst of
+    N duplicates costs one round trip.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bypass = kwargs.pop("bypass_cache", False)
+            # List-valued arguments (database_ids, host_ids) must be frozen
+            # into tuples so the key stays hashable
+            key = (
+                fn.__name__,
+                tuple(tuple(a) if isinstance(a, list) else a for a in args),
+                tuple(sorted(
+                    (k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()
+                )),
+            )
+            now = time.monotonic()
+            leader_future = None
+            if not bypass:
+                with _TTL_CACHE_LOCK:
+                    hit = _TTL_CACHE.get(key)
+                    if hit is not None and now - hit[0] < seconds:
+                        return hit[1]
+                with _INFLIGHT_LOCK:
+                    existing = _INFLIGHT.get(key)
+                    if existing is None:
+                        leader_future = Future()
+                        _INFLIGHT[key] = leader_future
+                if existing is not None:
+                    return existing.result()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                if leader_future is not None:
+                    with _INFLIGHT_LOCK:
+                        _INFLIGHT.pop(key, None)
+                    leader_future.set_exception(exc)
+                raise
+            if leader_future is not None:
+                with _INFLIGHT_LOCK:
+                    _INFLIGHT.pop(key, None)
+                leader_future.set_result(result)
+            if isinstance(result, dict) and "error" not in result:
+                with _TTL_CACHE_LOCK:
+                    if len(_TTL_CACHE) >= _TTL_CACHE_MAX_ENTRIES:
+                        _TTL_CACHE.clear()
+                    _TTL_CACHE[key] = (now, result)
+            return result
+        return wrapper
+    return decorator
+
+
+# The region-detection fallback reads the on-disk database cache; re-parsing
+# that JSON on every call costs tens of ms, so keep one loaded instance and
+# reload only when the backing file changes.
+_DB_CACHE: Optional[DatabaseCache] = None
+_DB_CACHE_MTIME: float = 0.0
+_DB_CACHE_LOCK = threading.Lock()
+
+
+def _get_db_cache() -> Optional[DatabaseCache]:
+    """Return a shared, loaded DatabaseCache, or None if no cache file exists."""
+    global _DB_CACHE, _DB_CACHE_MTIME
+    with _DB_CACHE_LOCK:
+        cache = _DB_CACHE or DatabaseCache()
+        try:
+            mtime = cache.cache_file.stat().st_mtime
+        except OSError:
+            return None
+        if _DB_CACHE is None or mtime != _DB_CACHE_MTIME:
+            if not cache.load():
+                return None
+            _DB_CACHE = cache
+            _DB_CACHE_MTIME = mtime
+        return _DB_CACHE
+
+
+# Shared pool for fanning out independent OCI calls: the tools here are
+# I/O-bound, so batched invocations finish in ~max(call) instead of sum(call)
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="opsi-ext",
+)
+
+# Separate pool for work submitted FROM tasks that may themselves be running
+# on _EXECUTOR (page prefetch, per-region shards inside a batched tool call).
+# Nesting into one bounded pool can deadlock when it saturates: every worker
+# blocks on an inner future that has no worker left to run it.
+_NESTED_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="opsi-ext-nested",
+)
+
+# Read-only tools in this module that run_opsi_batch may dispatch to
+_BATCH_TOOL_NAMES = frozenset({
+    "list_host_insights",
+    "list_exadata_insights",
+    "summarize_sql_statistics",
+    "get_sql_plan",
+    "summarize_database_insight_resource_capacity_trend",
+    "summarize_database_insight_resource_forecast",
+    "summarize_host_insight_resource_statistics",
+    "summarize_host_insight_resource_forecast_trend",
+    "summarize_host_insight_resource_capacity_trend",
+    "summarize_host_insight_resource_usage",
+    "summarize_host_insight_resource_usage_trend",
+    "summarize_host_insight_resource_utilization_insight",
+})
+
+
+def _paged(call, **kwargs: Any):
+    """Yield items across all pages, prefetching the next page in flight.
+
+    The next-page request is submitted to the shared executor before the
+    current page's items are yielded, so the caller's row materialization
+    overlaps with the following round trip instead of serializing N page
+    fetches.
+    """
+    response = call(**kwargs)
+    while True:
+        pending = None
+        next_page = getattr(response, "next_page", None)
+        if next_page:
+            pending = _NESTED_EXECUTOR.submit(call, page=next_page, **kwargs)
+
+        data = getattr(response, "data", None)
+        if isinstance(data, list):
+            yield from data
+        else:
+            yield from getattr(data, "items", None) or ()
+
+        if pending is None:
+            return
+        response = pending.result()
+
+
+def _paged_limited(call, max_items: int, page_token: Optional[str], **kwargs: Any):
+    """Fetch up to ``max_items`` items starting at ``page_token``.
+
+    Returns (items, next_page_token). The page size starts small so the
+    first page comes back fast, then doubles up to the service maximum so
+    large bounded requests still need few round trips. Every request is
+    clamped to the remaining budget, so no page overshoots ``max_items``
+    and the returned token resumes exactly after the last item returned —
+    nothing is skipped and nothing is re-seen.
+    """
+    items: list = []
+    limit = 50
+    page = page_token
+    while True:
+        response = call(
+            **_nn(page=page, limit=min(limit, max_items - len(items)), **kwargs)
+        )
+        data = getattr(response, "data", None)
+        if isinstance(data, list):
+            items.extend(data)
+        else:
+            items.extend(getattr(data, "items", None) or ())
+        page = getattr(response, "next_page", None)
+        if not page or len(items) >= max_items:
+            break
+        limit = min(limit * 2, 1000)
+    return items, page
+
+
+def run_opsi_batch(requests: list) -> dict[str, Any]:
+    """
+    Run several read-only OPSI tool calls from this module concurrently.
 
+    Agents frequently invoke multiple independent listing/summarize tools in
+    one turn; each is a network-bound OCI round trip, so fanning them out on
+    a shared thread pool cuts wall time to roughly the slowest call instead
+    of the sum. A failure in one call never aborts the others — its error
+    dict is returned inline at the same index.
+
+    Args:
+        requests: List of {"tool": <tool name>, "params": {...}} dicts, where
+            tool is one of the read-only functions in this module (e.g.
+            "list_host_insights") and params are its keyword arguments.
+
+    Returns:
+        Dictionary with "results" (one entry per request, in order) and
+        "count".
+    """
+    def _invoke(req: dict) -> dict[str, Any]:
+        try:
+            tool = req.get("tool")
+            if tool not in _BATCH_TOOL_NAMES:
+                return {
+                    "error": f"Unknown or unsupported tool: {tool!r}",
+                    "type": "ValueError",
+                    "supported_tools": sorted(_BATCH_TOOL_NAMES),
+                }
+            return globals()[tool](**(req.get("params") or {}))
+        except Exception as e:
+            return _error_dict(e, tool=req.get("tool"))
+
+    futures = [_EXECUTOR.submit(_invoke, req) for req in requests]
+    results = [f.result() for f in futures]
+
+    return {"results": results, "count": len(results)}
+
+
+@_ttl_cache(seconds=300)
 def list_host_insights(
     compartment_id: str,
     lifecycle_state: Optional[str] = None,
     host_type: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_token: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     List host insights in a compartment.
@@ -19,6 +516,9 @@ def list_host_insights(
         compartment_id: Compartment OCID to query.
         lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE").
         host_type: Filter by host type.
+        max_items: Stop after this many items instead of draining every
+            page; the response then carries "next_page_token" for resuming.
+        page_token: Resume listing from a previous response's token.
 
     Returns:
         Dictionary containing list of host insights.
@@ -26,43 +526,33 @@ def list_host_insights(
     try:
         client = get_opsi_client()
 
-        kwargs = {"compartment_id": compartment_id}
-        if lifecycle_state:
-            kwargs["lifecycle_state"] = lifecycle_state
-        if host_type:
-            kwargs["host_type"] = [host_type]
-
-        host_insights = list_all(
-            client.list_host_insights,
-            **kwargs,
+        filters = _nn(
+            compartment_id=compartment_id,
+            lifecycle_state=lifecycle_state if lifecycle_state else None,
+            host_type=_as_list(host_type),
         )
 
-        items = []
-        for host in host_insights:
-            items.append({
-                "id": host.id,
-                "host_name": getattr(host, "host_name", None),
-                "host_display_name": getattr(host, "host_display_name", None),
-                "host_type": getattr(host, "host_type", None),
-                "platform_type": getattr(host, "platform_type", None),
-                "processor_count": getattr(host, "processor_count", None),
-                "status": host.status,
-                "lifecycle_state": host.lifecycle_state,
-                "time_created": str(host.time_created),
-            })
+        next_page_token = None
+        if max_items is not None or page_token is not None:
+            host_insights, next_page_token = _paged_limited(
+                client.list_host_insights, max_items or 1000, page_token, **filters
+            )
+        else:
+            host_insights = _paged(client.list_host_insights, **filters)
 
-        return {
+        items = [_host_row(host) for host in host_insights]
+
+        result = {
             "compartment_id": compartment_id,
             "items": items,
             "count": len(items),
         }
+        if next_page_token:
+            result["next_page_token"] = next_page_token
+        return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def _is_em_managed_database(database_insight_id: str, region: Optional[str] = None) -> bool:
@@ -198,11 +688,122 @@ def _query_sql_statistics_from_warehouse(
         }
 
 
+# Constant guidance payloads for summarize_sql_statistics error paths.
+# Built once at import instead of re-allocated on every failing call;
+# treat them as read-only.
+_WRONG_OCID_SOLUTION = {
+    "method_1": "Use get_fleet_summary() or search_databases() to find the database insight OCID",
+    "method_2": "Use list_database_insights() to list all insights in your compartment",
+    "method_3": "In OCI Console: Operations Insights → Database Insights → Copy the Insight OCID (not Database OCID)",
+}
+
+_WRONG_OCID_EXAMPLE = {
+    "wrong_ocid": "ocid1.autonomousdatabase.oc1.phx.xxx (Database OCID)",
+    "correct_ocid": "ocid1.opsidatabaseinsight.oc1.phx.yyy (Database Insight OCID)",
+}
+
+_EM_MANAGED_LIMITATION = {
+    "database_type": "EM_MANAGED_EXTERNAL_DATABASE",
+    "limitation": "SQL Statistics API is not supported for EM-Managed databases",
+    "alternatives": [
+        "Enable Operations Insights warehouse and wait for data population",
+        "Use Database Management Service Performance Hub APIs",
+        "Enable native OPSI agent on the database (requires reconfiguration)",
+    ],
+}
+
+_SQL_STATS_404_HELP = {
+    "possible_causes": [
+        "Database does not have Operations Insights enabled",
+        "Database is EM-Managed External Database (limited API support)",
+        "Missing IAM permissions for SQL statistics",
+        "Database insight ID is incorrect",
+        "Regional mismatch - database may be in different region",
+    ],
+    "required_permissions": [
+        "Allow group <YourGroup> to read sql-statistics in compartment",
+        "Allow group <YourGroup> to read opsi-data-objects in compartment",
+    ],
+    "next_steps": [
+        "Run diagnose_permissions.py to identify the root cause",
+        "Check if database is EM-Managed type (limited API support)",
+        "Verify database has Operations Insights enabled",
+        "Check IAM policies in the database compartment",
+        "Consider enabling warehouse queries for EM-Managed databases",
+    ],
+}
+
+
+def _sharded_sql_statistics(
+    compartment_id: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    by_region: dict,
+    as_columns: bool,
+    summary_only: bool,
+) -> dict[str, Any]:
+    """Fan out one summarize_sql_statistics call per region and merge.
+
+    OPSI endpoints are regional, so a database_ids list spanning regions
+    cannot go out as one request. One concurrent call per region group
+    keeps wall time at max(region latency); a failing region surfaces
+    under "errors" without discarding the others' rows.
+    """
+    futures = [
+        _NESTED_EXECUTOR.submit(
+            summarize_sql_statistics,
+            compartment_id,
+            time_interval_start,
+            time_interval_end,
+            database_ids=ids,
+            as_columns=as_columns,
+            summary_only=summary_only,
+        )
+        for ids in by_region.values()
+    ]
+    parts = [future.result() for future in futures]
+
+    result = {
+        "compartment_id": compartment_id,
+        "time_interval_start": time_interval_start,
+        "time_interval_end": time_interval_end,
+        "regions": list(by_region),
+    }
+    ok = [part for part in parts if "error" not in part]
+    errors = [part for part in parts if "error" in part]
+
+    if summary_only:
+        combined = [row for part in ok for row in part.get("top_sql_by_cpu", ())]
+        result["top_sql_by_cpu"] = heapq.nlargest(
+            10, combined, key=lambda row: row.get("cpu_time_in_sec") or 0.0
+        )
+        result["count"] = sum(part.get("count", 0) for part in ok)
+    elif as_columns:
+        columns: dict[str, list] = {}
+        for part in ok:
+            for name, values in part.get("columns", {}).items():
+                columns.setdefault(name, []).extend(values)
+        result["columns"] = columns
+        result["count"] = len(columns.get("sql_identifier", ()))
+    else:
+        items = [row for part in ok for row in part.get("items", ())]
+        result["items"] = items
+        result["count"] = len(items)
+
+    if errors:
+        result["errors"] = errors
+    return result
+
+
+@_ttl_cache(seconds=120)
 def summarize_sql_statistics(
     compartment_id: str,
     time_interval_start: str,
     time_interval_end: str,
     database_id: Optional[str] = None,
+    database_ids: Optional[list[str]] = None,
+    as_columns: bool = False,
+    summary_only: bool = False,
 ) -> dict[str, Any]:
     """
     Summarize SQL statistics for databases in a compartment.
@@ -220,6 +821,17 @@ def summarize_sql_statistics(
         time_interval_end: End time in ISO format (e.g., "2024-01-31T23:59:59Z").
         database_id: Optional database insight OCID to filter results.
                     Region will be automatically detected from this OCID.
+        database_ids: Optional list of database insight OCIDs; the whole
+                    list is sent as one batched filter instead of looping
+                    one call per database. IDs spanning multiple regions are
+                    sharded into one concurrent call per region and merged.
+                    Takes precedence over database_id; OCID validation and
+                    region detection use the first entry.
+        as_columns: If True, return "columns" (one list per field) instead
+                    of per-row "items" dicts - much cheaper to build and
+                    serialize for multi-thousand-row summaries.
+        summary_only: If True, return only the total count and the top 10
+                      statements by CPU time instead of every row.
 
     Returns:
         Dictionary containing SQL statistics summary.
@@ -231,6 +843,22 @@ def summarize_sql_statistics(
         3. The database is in the expected region
     """
     try:
+        if database_ids:
+            by_region: dict = {}
+            for did in database_ids:
+                by_region.setdefault(extract_region_from_ocid(did), []).append(did)
+            if len(by_region) > 1:
+                # Mixed-region ID list: one concurrent call per regional
+                # endpoint, merged into a single response
+                return _sharded_sql_statistics(
+                    compartment_id, time_interval_start, time_interval_end,
+                    by_region, as_columns, summary_only,
+                )
+            if not database_id:
+                # Validation and region detection key off the first ID; the
+                # full list still goes to the service as one batched filter.
+                database_id = database_ids[0]
+
         # Validate OCID type if database_id provided
         if database_id:
             resource_type = get_ocid_resource_type(database_id)
@@ -247,15 +875,8 @@ def summarize_sql_statistics(
                             "Database insight OCID format: ocid1.opsidatabaseinsight.oc1.<region>...",
                             f"You provided: ocid1.{resource_type}.oc1.<region>..."
                         ],
-                        "solution": {
-                            "method_1": "Use get_fleet_summary() or search_databases() to find the database insight OCID",
-                            "method_2": "Use list_database_insights() to list all insights in your compartment",
-                            "method_3": "In OCI Console: Operations Insights → Database Insights → Copy the Insight OCID (not Database OCID)"
-                        },
-                        "example": {
-                            "wrong_ocid": "ocid1.autonomousdatabase.oc1.phx.xxx (Database OCID)",
-                            "correct_ocid": "ocid1.opsidatabaseinsight.oc1.phx.yyy (Database Insight OCID)"
-                        }
+                        "solution": _WRONG_OCID_SOLUTION,
+                        "example": _WRONG_OCID_EXAMPLE,
                     }
                 }
 
@@ -270,9 +891,8 @@ def summarize_sql_statistics(
             # Method 2: Lookup in cache if OCID extraction fails
             if not region:
                 try:
-                    from mcp_oci_opsi.cache import DatabaseCache
-                    cache = DatabaseCache()
-                    if cache.load() and cache.is_valid():
+                    cache = _get_db_cache()
+                    if cache is not None and cache.is_valid():
                         region = cache.get_database_region(database_id)
                         if region:
                             print(f"Detected region from cache: {region}")
@@ -283,68 +903,47 @@ def summarize_sql_statistics(
         client = get_opsi_client(region=region)
 
         # Convert time strings to datetime objects
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if database_id:
-            kwargs["database_id"] = [database_id]
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        response = client.summarize_sql_statistics(
-            **kwargs,
-        )
-
-        items = []
-        if hasattr(response.data, "items"):
-            for item in response.data.items:
-                # Get database details
-                db_id = None
-                db_name = None
-                db_display_name = None
-                if hasattr(item, "database_details") and item.database_details:
-                    db_id = getattr(item.database_details, "id", None)
-                    db_name = getattr(item.database_details, "database_name", None)
-                    db_display_name = getattr(item.database_details, "database_display_name", None)
-
-                # Get statistics - they are nested in item.statistics
-                stats = {}
-                if hasattr(item, "statistics") and item.statistics:
-                    stats = {
-                        "executions_count": getattr(item.statistics, "executions_count", None),
-                        "executions_per_hour": getattr(item.statistics, "executions_per_hour", None),
-                        "cpu_time_in_sec": getattr(item.statistics, "cpu_time_in_sec", None),
-                        "io_time_in_sec": getattr(item.statistics, "io_time_in_sec", None),
-                        "database_time_in_sec": getattr(item.statistics, "database_time_in_sec", None),
-                        "database_time_pct": getattr(item.statistics, "database_time_pct", None),
-                        "inefficient_wait_time_in_sec": getattr(item.statistics, "inefficient_wait_time_in_sec", None),
-                        "response_time_in_sec": getattr(item.statistics, "response_time_in_sec", None),
-                        "average_active_sessions": getattr(item.statistics, "average_active_sessions", None),
-                        "plan_count": getattr(item.statistics, "plan_count", None),
-                        "variability": getattr(item.statistics, "variability", None),
-                    }
+        response = client.summarize_sql_statistics(**_nn(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            database_id=database_ids or _as_list(database_id),
+        ))
 
-                items.append({
-                    "sql_identifier": getattr(item, "sql_identifier", None),
-                    "database_id": db_id,
-                    "database_name": db_name,
-                    "database_display_name": db_display_name,
-                    "category": getattr(item, "category", None),
-                    **stats  # Unpack statistics into the item dict
-                })
+        src = getattr(response.data, "items", None) or ()
 
         result = {
             "compartment_id": compartment_id,
             "time_interval_start": time_interval_start,
             "time_interval_end": time_interval_end,
-            "items": items,
-            "count": len(items),
         }
 
+        if not src:
+            # Zero-row responses are common in exploratory queries; skip the
+            # row-building branches entirely.
+            result["items"] = []
+            result["count"] = 0
+        elif summary_only:
+            top = heapq.nlargest(
+                10,
+                src,
+                key=lambda it: getattr(getattr(it, "statistics", None), "cpu_time_in_sec", None)
+                or 0.0,
+            )
+            result["top_sql_by_cpu"] = [_sql_stat_row(item) for item in top]
+            result["count"] = len(src)
+        elif as_columns:
+            columns = _sql_stat_columns(src)
+            result["columns"] = columns
+            result["count"] = len(columns["sql_identifier"])
+        else:
+            items = [_sql_stat_row(item) for item in src]
+            result["items"] = items
+            result["count"] = len(items)
+
         if region:
             result["detected_region"] = region
 
@@ -383,15 +982,7 @@ def summarize_sql_statistics(
                 else:
                     # Warehouse fallback also failed, add EM-Managed specific guidance
                     warehouse_result["em_managed_database"] = True
-                    warehouse_result["additional_info"] = {
-                        "database_type": "EM_MANAGED_EXTERNAL_DATABASE",
-                        "limitation": "SQL Statistics API is not supported for EM-Managed databases",
-                        "alternatives": [
-                            "Enable Operations Insights warehouse and wait for data population",
-                            "Use Database Management Service Performance Hub APIs",
-                            "Enable native OPSI agent on the database (requires reconfiguration)"
-                        ]
-                    }
+                    warehouse_result["additional_info"] = _EM_MANAGED_LIMITATION
 
                 return warehouse_result
 
@@ -404,35 +995,42 @@ def summarize_sql_statistics(
 
         # Add troubleshooting guidance for common errors
         if is_404_error:
-            error_result["troubleshooting"] = {
-                "possible_causes": [
-                    "Database does not have Operations Insights enabled",
-                    "Database is EM-Managed External Database (limited API support)",
-                    "Missing IAM permissions for SQL statistics",
-                    "Database insight ID is incorrect",
-                    "Regional mismatch - database may be in different region"
-                ],
-                "required_permissions": [
-                    "Allow group <YourGroup> to read sql-statistics in compartment",
-                    "Allow group <YourGroup> to read opsi-data-objects in compartment"
-                ],
-                "next_steps": [
-                    "Run diagnose_permissions.py to identify the root cause",
-                    "Check if database is EM-Managed type (limited API support)",
-                    "Verify database has Operations Insights enabled",
-                    "Check IAM policies in the database compartment",
-                    "Consider enabling warehouse queries for EM-Managed databases"
-                ]
-            }
+            error_result["troubleshooting"] = _SQL_STATS_404_HELP
 
             if database_id:
-                detected_region = extract_region_from_ocid(database_id)
+                # region was already resolved before the call; no re-parse
+                detected_region = region or extract_region_from_ocid(database_id)
                 if detected_region:
                     error_result["detected_database_region"] = detected_region
 
         return error_result
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_sql_plan_cached(
+    compartment_id: str,
+    sql_identifier: str,
+    plan_hash: int,
+    database_id: Optional[str],
+) -> dict[str, Any]:
+    """Fetch one SQL plan; raises on failure so errors are never cached."""
+    client = get_opsi_client()
+
+    response = client.get_sql_plan(**_nn(
+        compartment_id=compartment_id,
+        sql_identifier=sql_identifier,
+        plan_hash=plan_hash,
+        database_id=_as_list(database_id),
+    ))
+
+    return {
+        "compartment_id": compartment_id,
+        "sql_identifier": sql_identifier,
+        "plan_hash": plan_hash,
+        "plan": str(response.data) if hasattr(response, "data") else None,
+    }
+
+
 def get_sql_plan(
     compartment_id: str,
     sql_identifier: str,
@@ -442,6 +1040,10 @@ def get_sql_plan(
     """
     Get SQL execution plan details for a specific SQL identifier.
 
+    A plan identified by its plan_hash is immutable, so results are held
+    in a process-wide LRU cache and repeat lookups of the same top-N SQL
+    never touch the network again.
+
     Args:
         compartment_id: Compartment OCID.
         sql_identifier: SQL identifier to retrieve plan for.
@@ -452,42 +1054,22 @@ def get_sql_plan(
         Dictionary containing SQL plan details.
     """
     try:
-        client = get_opsi_client()
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "sql_identifier": sql_identifier,
-            "plan_hash": plan_hash,
-        }
-
-        if database_id:
-            kwargs["database_id"] = [database_id]
-
-        response = client.get_sql_plan(
-            **kwargs,
-        )
-
-        return {
-            "compartment_id": compartment_id,
-            "sql_identifier": sql_identifier,
-            "plan_hash": plan_hash,
-            "plan": str(response.data) if hasattr(response, "data") else None,
-        }
+        return _get_sql_plan_cached(compartment_id, sql_identifier, plan_hash, database_id)
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "sql_identifier": sql_identifier,
-        }
+        return _error_dict(e, sql_identifier=sql_identifier)
 
 
+@_ttl_cache(seconds=600)
 def summarize_database_insight_resource_capacity_trend(
     compartment_id: str,
     resource_metric: str,
     time_interval_start: str,
     time_interval_end: str,
     database_id: Optional[str] = None,
+    database_ids: Optional[list[str]] = None,
+    timestamp_format: str = "iso",
+    summary_only: bool = False,
 ) -> dict[str, Any]:
     """
     Get capacity planning trends for database resource utilization.
@@ -501,58 +1083,62 @@ def summarize_database_insight_resource_capacity_trend(
         time_interval_start: Start time in ISO format.
         time_interval_end: End time in ISO format.
         database_id: Optional database OCID filter.
+        database_ids: Optional list of database OCIDs; one batched call
+            replaces a per-database loop. Takes precedence over database_id.
+        timestamp_format: "iso" (default) or "epoch_ms" for int timestamps.
+        summary_only: If True, return p50/p95/max utilization scalars
+            instead of the per-point trend list.
 
     Returns:
         Dictionary containing capacity trend analysis.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _DB_METRICS:
+        return _metric_error(resource_metric, _DB_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if database_id:
-            kwargs["database_id"] = [database_id]
-
-        response = client.summarize_database_insight_resource_capacity_trend(
-            **kwargs,
-        )
+        response = client.summarize_database_insight_resource_capacity_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            database_id=database_ids or _as_list(database_id),
+        ))
 
-        items = []
-        if hasattr(response.data, "items"):
-            for item in response.data.items:
-                items.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "capacity": getattr(item, "capacity", None),
-                    "usage": getattr(item, "usage", None),
-                    "utilization_percent": getattr(item, "utilization_percent", None),
-                })
+        src = getattr(response.data, "items", None) or ()
 
-        return {
+        result = {
             "compartment_id": compartment_id,
             "resource_metric": resource_metric,
             "time_interval_start": time_interval_start,
             "time_interval_end": time_interval_end,
-            "trend_items": items,
-            "count": len(items),
         }
 
+        if summary_only:
+            util = [
+                u for u in (getattr(item, "utilization_percent", None) for item in src)
+                if u is not None
+            ]
+            result["utilization_percent"] = _percentile_summary(util)
+            result["count"] = len(util)
+        else:
+            items = [_capacity_row(item, timestamp_format) for item in src]
+            result["trend_items"] = items
+            result["count"] = len(items)
+
+        return result
+
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
+@_ttl_cache(seconds=1800)
 def summarize_database_insight_resource_forecast(
     compartment_id: str,
     resource_metric: str,
@@ -560,6 +1146,8 @@ def summarize_database_insight_resource_forecast(
     time_interval_end: str,
     forecast_days: int = 30,
     database_id: Optional[str] = None,
+    database_ids: Optional[list[str]] = None,
+    timestamp_format: str = "iso",
 ) -> dict[str, Any]:
     """
     Get resource utilization forecast for capacity planning.
@@ -574,41 +1162,36 @@ def summarize_database_insight_resource_forecast(
         time_interval_end: End time in ISO format.
         forecast_days: Number of days to forecast (default 30).
         database_id: Optional database OCID filter.
+        database_ids: Optional list of database OCIDs; one batched call
+            replaces a per-database loop. Takes precedence over database_id.
 
     Returns:
         Dictionary containing resource forecast data.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _DB_METRICS:
+        return _metric_error(resource_metric, _DB_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-            "forecast_days": forecast_days,
-        }
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        if database_id:
-            kwargs["database_id"] = [database_id]
-
-        response = client.summarize_database_insight_resource_forecast_trend(
-            **kwargs,
-        )
-
-        forecast_items = []
-        if hasattr(response.data, "items"):
-            for item in response.data.items:
-                forecast_items.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "usage": getattr(item, "usage", None),
-                    "high_value": getattr(item, "high_value", None),
-                    "low_value": getattr(item, "low_value", None),
-                })
+        response = client.summarize_database_insight_resource_forecast_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            forecast_days=forecast_days,
+            database_id=database_ids or _as_list(database_id),
+        ))
+
+        forecast_items = [
+            _forecast_row(item, timestamp_format)
+            for item in getattr(response.data, "items", None) or ()
+        ]
 
         return {
             "compartment_id": compartment_id,
@@ -621,16 +1204,15 @@ def summarize_database_insight_resource_forecast(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
+@_ttl_cache(seconds=300)
 def list_exadata_insights(
     compartment_id: str,
     lifecycle_state: Optional[str] = None,
+    max_items: Optional[int] = None,
+    page_token: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     List Exadata insights in a compartment.
@@ -638,6 +1220,9 @@ def list_exadata_insights(
     Args:
         compartment_id: Compartment OCID to query.
         lifecycle_state: Filter by lifecycle state (e.g., "ACTIVE").
+        max_items: Stop after this many items instead of draining every
+            page; the response then carries "next_page_token" for resuming.
+        page_token: Resume listing from a previous response's token.
 
     Returns:
         Dictionary containing list of Exadata insights.
@@ -645,47 +1230,43 @@ def list_exadata_insights(
     try:
         client = get_opsi_client()
 
-        kwargs = {"compartment_id": compartment_id}
-        if lifecycle_state:
-            kwargs["lifecycle_state"] = lifecycle_state
-
-        exadata_insights = list_all(
-            client.list_exadata_insights,
-            **kwargs,
+        filters = _nn(
+            compartment_id=compartment_id,
+            lifecycle_state=lifecycle_state if lifecycle_state else None,
         )
 
-        items = []
-        for exadata in exadata_insights:
-            items.append({
-                "id": exadata.id,
-                "exadata_name": getattr(exadata, "exadata_name", None),
-                "exadata_display_name": getattr(exadata, "exadata_display_name", None),
-                "exadata_type": getattr(exadata, "exadata_type", None),
-                "status": exadata.status,
-                "lifecycle_state": exadata.lifecycle_state,
-                "time_created": str(exadata.time_created),
-            })
+        next_page_token = None
+        if max_items is not None or page_token is not None:
+            exadata_insights, next_page_token = _paged_limited(
+                client.list_exadata_insights, max_items or 1000, page_token, **filters
+            )
+        else:
+            exadata_insights = _paged(client.list_exadata_insights, **filters)
 
-        return {
+        items = [_exa_row(exadata) for exadata in exadata_insights]
+
+        result = {
             "compartment_id": compartment_id,
             "items": items,
             "count": len(items),
         }
+        if next_page_token:
+            result["next_page_token"] = next_page_token
+        return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
+@_ttl_cache(seconds=120)
 def summarize_host_insight_resource_statistics(
     compartment_id: str,
     resource_metric: str,
     time_interval_start: str,
     time_interval_end: str,
     host_id: Optional[str] = None,
+    host_ids: Optional[list[str]] = None,
+    summary_only: bool = False,
 ) -> dict[str, Any]:
     """
     Get resource statistics for host insights.
@@ -698,59 +1279,64 @@ def summarize_host_insight_resource_statistics(
         time_interval_start: Start time in ISO format.
         time_interval_end: End time in ISO format.
         host_id: Optional host insight OCID filter.
+        host_ids: Optional list of host insight OCIDs; one batched call
+            replaces a per-host loop. Takes precedence over host_id.
+        summary_only: If True, return p50/p95/max utilization scalars
+            instead of the per-host item list.
 
     Returns:
         Dictionary containing host resource statistics.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_resource_statistics(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_resource_statistics(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=host_ids or _as_list(host_id),
+        ))
 
-        items = []
-        if hasattr(response.data, "items"):
-            for item in response.data.items:
-                items.append({
-                    "resource_name": getattr(item, "resource_name", None),
-                    "usage": getattr(item, "usage", None),
-                    "capacity": getattr(item, "capacity", None),
-                    "utilization_percent": getattr(item, "utilization_percent", None),
-                    "usage_change_percent": getattr(item, "usage_change_percent", None),
-                })
+        src = getattr(response.data, "items", None) or ()
 
-        return {
+        result = {
             "compartment_id": compartment_id,
             "resource_metric": resource_metric,
             "time_interval_start": time_interval_start,
             "time_interval_end": time_interval_end,
-            "items": items,
-            "count": len(items),
         }
 
+        if summary_only:
+            util = [
+                u for u in (getattr(item, "utilization_percent", None) for item in src)
+                if u is not None
+            ]
+            result["utilization_percent"] = _percentile_summary(util)
+            result["count"] = len(util)
+        else:
+            items = [
+                dict(zip(_HOST_STAT_KEYS, _row_values(_HOST_STAT_GET, _HOST_STAT_KEYS, item)))
+                for item in src
+            ]
+            result["items"] = items
+            result["count"] = len(items)
+
+        return result
+
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
+@_ttl_cache(seconds=1800)
 def summarize_host_insight_resource_forecast_trend(
     compartment_id: str,
     resource_metric: str,
@@ -759,6 +1345,7 @@ def summarize_host_insight_resource_forecast_trend(
     forecast_days: int = 30,
     host_id: Optional[str] = None,
     statistic: Optional[str] = "AVG",
+    timestamp_format: str = "iso",
 ) -> dict[str, Any]:
     """
     Get ML-based resource utilization forecast for host capacity planning.
@@ -779,40 +1366,31 @@ def summarize_host_insight_resource_forecast_trend(
     Returns:
         Dictionary containing resource forecast data with trend analysis.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-            "forecast_days": forecast_days,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        if statistic:
-            kwargs["statistic"] = statistic
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        response = client.summarize_host_insight_resource_forecast_trend(
-            **kwargs,
-        )
-
-        forecast_items = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                forecast_items.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "usage": getattr(item, "usage", None),
-                    "high_value": getattr(item, "high_value", None),
-                    "low_value": getattr(item, "low_value", None),
-                })
+        response = client.summarize_host_insight_resource_forecast_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            forecast_days=forecast_days,
+            id=_as_list(host_id),
+            statistic=statistic if statistic else None,
+        ))
+
+        forecast_items = [
+            _forecast_row(item, timestamp_format)
+            for item in getattr(response.data, "usage_data", None) or ()
+        ]
 
         result = {
             "compartment_id": compartment_id,
@@ -827,9 +1405,9 @@ def summarize_host_insight_resource_forecast_trend(
 
         # Add summary data if available
         if hasattr(response.data, "time_interval_start"):
-            result["response_time_start"] = str(response.data.time_interval_start)
+            result["response_time_start"] = _iso(response.data.time_interval_start)
         if hasattr(response.data, "time_interval_end"):
-            result["response_time_end"] = str(response.data.time_interval_end)
+            result["response_time_end"] = _iso(response.data.time_interval_end)
         if hasattr(response.data, "item_duration_in_ms"):
             result["item_duration_in_ms"] = response.data.item_duration_in_ms
         if hasattr(response.data, "usage_unit"):
@@ -838,14 +1416,10 @@ def summarize_host_insight_resource_forecast_trend(
         return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-        }
+        return _error_dict(e, compartment_id=compartment_id, resource_metric=resource_metric)
 
 
+@_ttl_cache(seconds=600)
 def summarize_host_insight_resource_capacity_trend(
     compartment_id: str,
     resource_metric: str,
@@ -853,6 +1427,7 @@ def summarize_host_insight_resource_capacity_trend(
     time_interval_end: str,
     host_id: Optional[str] = None,
     utilization_level: Optional[str] = None,
+    timestamp_format: str = "iso",
 ) -> dict[str, Any]:
     """
     Get capacity planning trends for host resource utilization.
@@ -871,39 +1446,30 @@ def summarize_host_insight_resource_capacity_trend(
     Returns:
         Dictionary containing capacity trend analysis.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        if utilization_level:
-            kwargs["utilization_level"] = utilization_level
-
-        response = client.summarize_host_insight_resource_capacity_trend(
-            **kwargs,
-        )
-
-        trend_items = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                trend_items.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "capacity": getattr(item, "capacity", None),
-                    "usage": getattr(item, "usage", None),
-                    "utilization_percent": getattr(item, "utilization_percent", None),
-                })
+        response = client.summarize_host_insight_resource_capacity_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+            utilization_level=utilization_level if utilization_level else None,
+        ))
+
+        trend_items = [
+            _capacity_row(item, timestamp_format)
+            for item in getattr(response.data, "usage_data", None) or ()
+        ]
 
         result = {
             "compartment_id": compartment_id,
@@ -922,11 +1488,7 @@ def summarize_host_insight_resource_capacity_trend(
         return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_resource_usage(
@@ -951,38 +1513,35 @@ def summarize_host_insight_resource_usage(
     Returns:
         Dictionary containing resource usage summary.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_resource_usage(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_resource_usage(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         items = []
-        if hasattr(response.data, "items") and response.data.items:
-            for item in response.data.items:
-                items.append({
-                    "host_id": getattr(item, "id", None),
-                    "host_name": getattr(item, "host_name", None),
-                    "platform_type": getattr(item, "platform_type", None),
-                    "usage": getattr(item, "usage", None),
-                    "capacity": getattr(item, "capacity", None),
-                    "utilization_percent": getattr(item, "utilization_percent", None),
-                })
+        for item in getattr(response.data, "items", None) or ():
+            items.append({
+                "host_id": getattr(item, "id", None),
+                "host_name": getattr(item, "host_name", None),
+                "platform_type": getattr(item, "platform_type", None),
+                "usage": getattr(item, "usage", None),
+                "capacity": getattr(item, "capacity", None),
+                "utilization_percent": getattr(item, "utilization_percent", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -994,11 +1553,7 @@ def summarize_host_insight_resource_usage(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_resource_usage_trend(
@@ -1023,35 +1578,32 @@ def summarize_host_insight_resource_usage_trend(
     Returns:
         Dictionary containing resource usage trend data.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_resource_usage_trend(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_resource_usage_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         usage_data = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                usage_data.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "usage": getattr(item, "usage", None),
-                    "capacity": getattr(item, "capacity", None),
-                })
+        for item in getattr(response.data, "usage_data", None) or ():
+            usage_data.append({
+                "end_timestamp": _iso(getattr(item, "end_timestamp", None)),
+                "usage": getattr(item, "usage", None),
+                "capacity": getattr(item, "capacity", None),
+            })
 
         result = {
             "compartment_id": compartment_id,
@@ -1070,11 +1622,7 @@ def summarize_host_insight_resource_usage_trend(
         return result
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_resource_utilization_insight(
@@ -1102,38 +1650,35 @@ def summarize_host_insight_resource_utilization_insight(
     Returns:
         Dictionary containing utilization insights and recommendations.
     """
+    resource_metric = resource_metric.upper()
+    if resource_metric not in _HOST_METRICS:
+        return _metric_error(resource_metric, _HOST_METRICS)
+
     try:
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-            "forecast_days": forecast_days,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_resource_utilization_insight(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_resource_utilization_insight(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            forecast_days=forecast_days,
+            id=_as_list(host_id),
+        ))
 
         items = []
-        if hasattr(response.data, "items") and response.data.items:
-            for item in response.data.items:
-                items.append({
-                    "host_id": getattr(item, "id", None),
-                    "host_name": getattr(item, "host_name", None),
-                    "current_utilization": getattr(item, "current_utilization", None),
-                    "projected_utilization": getattr(item, "projected_utilization", None),
-                    "days_to_reach_capacity": getattr(item, "days_to_reach_capacity", None),
-                })
+        for item in getattr(response.data, "items", None) or ():
+            items.append({
+                "host_id": getattr(item, "id", None),
+                "host_name": getattr(item, "host_name", None),
+                "current_utilization": getattr(item, "current_utilization", None),
+                "projected_utilization": getattr(item, "projected_utilization", None),
+                "days_to_reach_capacity": getattr(item, "days_to_reach_capacity", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1146,11 +1691,7 @@ def summarize_host_insight_resource_utilization_insight(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 def summarize_host_insight_disk_statistics(
     compartment_id: str,
@@ -1186,32 +1727,25 @@ def summarize_host_insight_disk_statistics(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_disk_statistics(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_disk_statistics(**_nn(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         items = []
-        if hasattr(response.data, "items") and response.data.items:
-            for item in response.data.items:
-                items.append({
-                    "disk_name": getattr(item, "disk_name", None),
-                    "disk_read_in_mbs": getattr(item, "disk_read_in_mbs", None),
-                    "disk_write_in_mbs": getattr(item, "disk_write_in_mbs", None),
-                    "disk_iops": getattr(item, "disk_iops", None),
-                    "disk_io_time_in_sec": getattr(item, "disk_io_time_in_sec", None),
-                })
+        for item in getattr(response.data, "items", None) or ():
+            items.append({
+                "disk_name": getattr(item, "disk_name", None),
+                "disk_read_in_mbs": getattr(item, "disk_read_in_mbs", None),
+                "disk_write_in_mbs": getattr(item, "disk_write_in_mbs", None),
+                "disk_iops": getattr(item, "disk_iops", None),
+                "disk_io_time_in_sec": getattr(item, "disk_io_time_in_sec", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1222,11 +1756,7 @@ def summarize_host_insight_disk_statistics(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_io_usage_trend(
@@ -1263,31 +1793,24 @@ def summarize_host_insight_io_usage_trend(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        response = client.summarize_host_insight_io_usage_trend(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_io_usage_trend(**_nn(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         usage_data = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                usage_data.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "disk_read_in_mbs": getattr(item, "disk_read_in_mbs", None),
-                    "disk_write_in_mbs": getattr(item, "disk_write_in_mbs", None),
-                    "disk_iops": getattr(item, "disk_iops", None),
-                })
+        for item in getattr(response.data, "usage_data", None) or ():
+            usage_data.append({
+                "end_timestamp": _iso(getattr(item, "end_timestamp", None)),
+                "disk_read_in_mbs": getattr(item, "disk_read_in_mbs", None),
+                "disk_write_in_mbs": getattr(item, "disk_write_in_mbs", None),
+                "disk_iops": getattr(item, "disk_iops", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1298,11 +1821,7 @@ def summarize_host_insight_io_usage_trend(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_network_usage_trend(
@@ -1339,30 +1858,23 @@ def summarize_host_insight_network_usage_trend(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_network_usage_trend(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_network_usage_trend(**_nn(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         usage_data = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                usage_data.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "network_read_in_mbs": getattr(item, "network_read_in_mbs", None),
-                    "network_write_in_mbs": getattr(item, "network_write_in_mbs", None),
-                })
+        for item in getattr(response.data, "usage_data", None) or ():
+            usage_data.append({
+                "end_timestamp": _iso(getattr(item, "end_timestamp", None)),
+                "network_read_in_mbs": getattr(item, "network_read_in_mbs", None),
+                "network_write_in_mbs": getattr(item, "network_write_in_mbs", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1373,11 +1885,7 @@ def summarize_host_insight_network_usage_trend(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_storage_usage_trend(
@@ -1414,31 +1922,24 @@ def summarize_host_insight_storage_usage_trend(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_storage_usage_trend(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_storage_usage_trend(**_nn(
+            compartment_id=compartment_id,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         usage_data = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                usage_data.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "filesystem_usage": getattr(item, "filesystem_usage", None),
-                    "filesystem_capacity": getattr(item, "filesystem_capacity", None),
-                    "filesystem_utilization_percent": getattr(item, "filesystem_utilization_percent", None),
-                })
+        for item in getattr(response.data, "usage_data", None) or ():
+            usage_data.append({
+                "end_timestamp": _iso(getattr(item, "end_timestamp", None)),
+                "filesystem_usage": getattr(item, "filesystem_usage", None),
+                "filesystem_capacity": getattr(item, "filesystem_capacity", None),
+                "filesystem_utilization_percent": getattr(item, "filesystem_utilization_percent", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1449,11 +1950,7 @@ def summarize_host_insight_storage_usage_trend(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_top_processes_usage(
@@ -1494,34 +1991,27 @@ def summarize_host_insight_top_processes_usage(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-            "limit": limit,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        response = client.summarize_host_insight_top_processes_usage(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_top_processes_usage(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            limit=limit,
+            id=_as_list(host_id),
+        ))
 
         items = []
-        if hasattr(response.data, "items") and response.data.items:
-            for item in response.data.items:
-                items.append({
-                    "process_name": getattr(item, "process_name", None),
-                    "process_command": getattr(item, "process_command", None),
-                    "process_id": getattr(item, "process_id", None),
-                    "cpu_usage": getattr(item, "cpu_usage", None),
-                    "memory_usage": getattr(item, "memory_usage", None),
-                })
+        for item in getattr(response.data, "items", None) or ():
+            items.append({
+                "process_name": getattr(item, "process_name", None),
+                "process_command": getattr(item, "process_command", None),
+                "process_id": getattr(item, "process_id", None),
+                "cpu_usage": getattr(item, "cpu_usage", None),
+                "memory_usage": getattr(item, "memory_usage", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1533,11 +2023,7 @@ def summarize_host_insight_top_processes_usage(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_top_processes_usage_trend(
@@ -1576,32 +2062,25 @@ def summarize_host_insight_top_processes_usage_trend(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
-
-        response = client.summarize_host_insight_top_processes_usage_trend(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_top_processes_usage_trend(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         usage_data = []
-        if hasattr(response.data, "usage_data") and response.data.usage_data:
-            for item in response.data.usage_data:
-                usage_data.append({
-                    "end_timestamp": str(getattr(item, "end_timestamp", None)),
-                    "process_name": getattr(item, "process_name", None),
-                    "cpu_usage": getattr(item, "cpu_usage", None),
-                    "memory_usage": getattr(item, "memory_usage", None),
-                })
+        for item in getattr(response.data, "usage_data", None) or ():
+            usage_data.append({
+                "end_timestamp": _iso(getattr(item, "end_timestamp", None)),
+                "process_name": getattr(item, "process_name", None),
+                "cpu_usage": getattr(item, "cpu_usage", None),
+                "memory_usage": getattr(item, "memory_usage", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1613,11 +2092,7 @@ def summarize_host_insight_top_processes_usage_trend(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
 
 
 def summarize_host_insight_host_recommendation(
@@ -1656,33 +2131,26 @@ def summarize_host_insight_host_recommendation(
         client = get_opsi_client()
 
         # Convert time strings to datetime
-        time_start = datetime.fromisoformat(time_interval_start.replace("Z", "+00:00"))
-        time_end = datetime.fromisoformat(time_interval_end.replace("Z", "+00:00"))
-
-        kwargs = {
-            "compartment_id": compartment_id,
-            "resource_metric": resource_metric,
-            "time_interval_start": time_start,
-            "time_interval_end": time_end,
-        }
-
-        if host_id:
-            kwargs["id"] = [host_id]
+        time_start = _parse_iso(time_interval_start)
+        time_end = _parse_iso(time_interval_end)
 
-        response = client.summarize_host_insight_host_recommendation(
-            **kwargs,
-        )
+        response = client.summarize_host_insight_host_recommendation(**_nn(
+            compartment_id=compartment_id,
+            resource_metric=resource_metric,
+            time_interval_start=time_start,
+            time_interval_end=time_end,
+            id=_as_list(host_id),
+        ))
 
         items = []
-        if hasattr(response.data, "items") and response.data.items:
-            for item in response.data.items:
-                items.append({
-                    "host_id": getattr(item, "id", None),
-                    "host_name": getattr(item, "host_name", None),
-                    "recommendation_type": getattr(item, "recommendation_type", None),
-                    "recommendation_details": getattr(item, "recommendation_details", None),
-                    "estimated_savings": getattr(item, "estimated_savings", None),
-                })
+        for item in getattr(response.data, "items", None) or ():
+            items.append({
+                "host_id": getattr(item, "id", None),
+                "host_name": getattr(item, "host_name", None),
+                "recommendation_type": getattr(item, "recommendation_type", None),
+                "recommendation_details": getattr(item, "recommendation_details", None),
+                "estimated_savings": getattr(item, "estimated_savings", None),
+            })
 
         return {
             "compartment_id": compartment_id,
@@ -1694,8 +2162,141 @@ def summarize_host_insight_host_recommendation(
         }
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "type": type(e).__name__,
-            "compartment_id": compartment_id,
-        }
+        return _error_dict(e, compartment_id=compartment_id)
+
+
+async def list_host_insights_async(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+    host_type: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of list_host_insights (blocking call off-loop)."""
+    return await asyncio.to_thread(list_host_insights, compartment_id, lifecycle_state, host_type)
+
+
+async def list_exadata_insights_async(
+    compartment_id: str,
+    lifecycle_state: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of list_exadata_insights (blocking call off-loop)."""
+    return await asyncio.to_thread(list_exadata_insights, compartment_id, lifecycle_state)
+
+
+async def summarize_sql_statistics_async(
+    compartment_id: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    database_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of summarize_sql_statistics (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        summarize_sql_statistics, compartment_id, time_interval_start, time_interval_end, database_id
+    )
+
+
+async def summarize_host_insight_resource_statistics_async(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    host_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of summarize_host_insight_resource_statistics (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        summarize_host_insight_resource_statistics,
+        compartment_id, resource_metric, time_interval_start, time_interval_end, host_id,
+    )
+
+
+async def summarize_database_insight_resource_capacity_trend_async(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    database_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of summarize_database_insight_resource_capacity_trend (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        summarize_database_insight_resource_capacity_trend,
+        compartment_id, resource_metric, time_interval_start, time_interval_end, database_id,
+    )
+
+
+async def summarize_host_insight_resource_capacity_trend_async(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    host_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of summarize_host_insight_resource_capacity_trend (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        summarize_host_insight_resource_capacity_trend,
+        compartment_id, resource_metric, time_interval_start, time_interval_end, host_id,
+    )
+
+
+async def summarize_database_insight_resource_forecast_async(
+    compartment_id: str,
+    resource_metric: str,
+    time_interval_start: str,
+    time_interval_end: str,
+    forecast_days: int = 30,
+    database_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Async variant of summarize_database_insight_resource_forecast (blocking call off-loop)."""
+    return await asyncio.to_thread(
+        summarize_database_insight_resource_forecast,
+        compartment_id, resource_metric, time_interval_start, time_interval_end,
+        forecast_days, database_id,
+    )
+
+
+async def get_host_overview(
+    compartment_id: str,
+    resource_metric: str = "CPU",
+    time_interval_start: Optional[str] = None,
+    time_interval_end: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Fetch the common host dashboard bundle with one concurrent fan-out.
+
+    Gathers the host inventory, per-host resource statistics, and the
+    capacity trend for a compartment in parallel, so wall time is the
+    slowest call instead of the sum of all three.
+
+    Args:
+        compartment_id: Compartment OCID to query.
+        resource_metric: Resource metric for statistics and trend (default CPU).
+        time_interval_start: Start time in ISO format. Defaults to 24 hours ago.
+        time_interval_end: End time in ISO format. Defaults to now.
+
+    Returns:
+        Dictionary with "hosts", "statistics", and "capacity_trend" sections.
+    """
+    if time_interval_end is None:
+        time_interval_end = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    if time_interval_start is None:
+        time_interval_start = (datetime.now(timezone.utc) - timedelta(hours=24)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
+
+    hosts, stats, trend = await asyncio.gather(
+        list_host_insights_async(compartment_id),
+        summarize_host_insight_resource_statistics_async(
+            compartment_id, resource_metric, time_interval_start, time_interval_end
+        ),
+        summarize_host_insight_resource_capacity_trend_async(
+            compartment_id, resource_metric, time_interval_start, time_interval_end
+        ),
+    )
+
+    return {
+        "compartment_id": compartment_id,
+        "resource_metric": resource_metric,
+        "time_interval_start": time_interval_start,
+        "time_interval_end": time_interval_end,
+        "hosts": hosts,
+        "statistics": stats,
+        "capacity_trend": trend,
+    }